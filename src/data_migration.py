@@ -1,23 +1,14 @@
-from sqlalchemy import create_engine, select, text
 import pandas as pd
 import numpy as np
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
-from config import Config
+from functools import lru_cache
+import io
+from typing import Dict, Any, Iterator
+from config import config
 from framework import phase, Phase
-from models import (
-    SourceModel, TargetModel, 
-    SourceDetailModel, TargetDetailModel,
-    init_db, get_session
-)
-# Import Pydantic validators
-from validators import (
-    validate_source_data,
-    validate_transformed_data,
-    SourceRecord,
-    SourceDetailRecord,
-    SourceDataset
-)
+# SQLAlchemy, the ORM models, the Pydantic validators and the (optionally
+# Numba-compiled) kernels are imported where they are used, so importing this
+# module doesn't pay for them until a phase actually runs
 import logging
 
 # Setup logging
@@ -27,70 +18,60 @@ logging.basicConfig(
 )
 logger = logging.getLogger("data_migration")
 
-# Create global SQLAlchemy engine connections
-source_engine = create_engine(Config.SOURCE_DB_URI)
-target_engine = create_engine(Config.TARGET_DB_URI)
+# Buckets used for the derived 'category' column
+CATEGORY_LEVELS = ['low', 'medium', 'high']
+
+# Rows per extracted chunk, and rows per multi-row INSERT statement
+CHUNK_SIZE = 50_000
+INSERT_BATCH_SIZE = 1000
+
+# Columns loaded into target_table and target_detail (the detail id is generated)
+TARGET_COLUMNS = ['id', 'column1', 'column2', 'column3_transformed', 'migrated_at']
+DETAIL_COLUMNS = ['target_id', 'detail_data']
+
+# Chunks are loaded into these staging tables first and swapped into the
+# target tables in a single transaction once every chunk has been written
+TARGET_STAGING_TABLE = 'target_table_stg'
+DETAIL_STAGING_TABLE = 'target_detail_stg'
+
+# Source rows joined with their (optional) detail rows
+EXTRACT_QUERY = """
+    SELECT s.id, s.column1, s.column2, s.column3, s.created_at,
+           d.id AS detail_id, d.detail_data
+    FROM source_table s
+    LEFT JOIN source_detail d ON d.source_id = s.id
+"""
+
+# Engines are created on first use instead of at import time
+@lru_cache(maxsize=1)
+def get_source_engine():
+    """Return the shared SQLAlchemy engine for the source database"""
+    from sqlalchemy import create_engine
+    return create_engine(config.SOURCE_DB_URI)
+
+@lru_cache(maxsize=1)
+def get_target_engine():
+    """Return the shared SQLAlchemy engine for the target database"""
+    from sqlalchemy import create_engine
+    return create_engine(config.TARGET_DB_URI)
 
 # Initialize databases if needed
 def setup_databases():
     """Initialize both source and target databases with required tables"""
-    init_db(source_engine)
-    init_db(target_engine)
+    from models import init_db
+    init_db(get_source_engine())
+    init_db(get_target_engine())
 
-@phase(Phase.EXTRACT)
-def fetch_data_from_source():
-    """Extract data from source database using both raw SQL and ORM approaches"""
-    logger.info("Starting data extraction phase")
-    
-    # Method 1: Using pandas read_sql with raw SQL query
-    query = "SELECT * FROM source_table"
-    df_raw = pd.read_sql(query, source_engine)
-    
-    # Method 2: Using SQLAlchemy 2.0 ORM with select statement
-    with get_session(source_engine) as session:
-        # Get main source data
-        stmt = select(SourceModel)
-        result = session.execute(stmt).scalars().all()
-        source_data = [item.to_dict() for item in result]
-        
-        # Get related details data
-        detail_stmt = select(SourceDetailModel)
-        detail_result = session.execute(detail_stmt).scalars().all()
-        details_data = [{
-            'id': detail.id,
-            'source_id': detail.source_id,
-            'detail_data': detail.detail_data
-        } for detail in detail_result]
-    
-    # Convert ORM data to DataFrame
-    df_orm = pd.DataFrame(source_data)
-    df_details = pd.DataFrame(details_data)
-    
-    # Merge the datasets (optional)
-    if not df_orm.empty and not df_details.empty and 'id' in df_orm and 'source_id' in df_details:
-        df_merged = pd.merge(df_orm, df_details, left_on='id', right_on='source_id', how='left')
-    else:
-        df_merged = df_orm
-    
-    # Create result dictionary
-    data_dict = {
-        'df_raw': df_raw,
-        'df_orm': df_orm, 
-        'df_details': df_details,
-        'df_merged': df_merged
-    }
-    
-    # Validate source data using Pydantic
-    validation_results = validate_source_data(data_dict)
-    
+def log_source_validation(validation_results: Dict[str, Any]) -> None:
+    """Log the outcome of validating a chunk of source data"""
     if not validation_results["valid"]:
         logger.warning("Source data validation failed")
         logger.debug(f"Validation details: {validation_results['validation_details']}")
         
         # Example: Handle validation failures (can be customized)
-        if Config.features.get("data_validation", False):
+        if config.features.get("data_validation", False):
             # Depending on configuration, raise exception or continue with warning
-            if Config.enable_detailed_logging:
+            if config.enable_detailed_logging:
                 for source, result in validation_results["validation_details"].items():
                     if not result.get("valid", False):
                         logger.error(f"Validation failed for {source}: {result.get('errors', [])}")
@@ -99,149 +80,106 @@ def fetch_data_from_source():
             # raise ValueError(f"Source data validation failed: {validation_results}")
     else:
         logger.info("Source data validation successful")
-    
-    # Add validation results to the output
-    data_dict['validation_results'] = validation_results
-    
-    return data_dict
 
-def validate_and_clean_row(
-    row: pd.Series, 
-    invalid_rows: List[int], 
-    row_index: int
-) -> Tuple[bool, Optional[pd.Series]]:
-    """
-    Validate a single row and attempt to clean/fix issues.
-    
-    Args:
-        row: The row to validate and clean
-        invalid_rows: List to collect indices of rows that can't be fixed
-        row_index: Index of the current row
-        
-    Returns:
-        Tuple with (is_valid, cleaned_row)
-    """
-    # Create a copy to avoid modifying the original
-    cleaned_row = row.copy()
-    is_valid = True
-    
-    # Perform common cleaning operations
-    if 'column1' in cleaned_row and pd.isna(cleaned_row['column1']):
-        # Column1 is required - mark as invalid
-        invalid_rows.append(row_index)
-        is_valid = False
-    
-    if 'column2' in cleaned_row and pd.isna(cleaned_row['column2']):
-        # Column2 is optional - replace with default
-        cleaned_row['column2'] = 'N/A'
-    
-    if 'column3' in cleaned_row:
-        if pd.isna(cleaned_row['column3']):
-            # Missing numeric value - set to default
-            cleaned_row['column3'] = 0
-        elif cleaned_row['column3'] < 0:
-            # Negative values not allowed - use absolute value
-            cleaned_row['column3'] = abs(cleaned_row['column3'])
-        elif cleaned_row['column3'] > 1000:
-            # Values over 1000 not allowed - cap at 1000
-            cleaned_row['column3'] = 1000
-    
-    # Try to validate using Pydantic (for more complex validation)
-    try:
-        if all(k in cleaned_row for k in ['id', 'column1']):
-            record_dict = {k: v for k, v in cleaned_row.items() if k in 
-                         ['id', 'column1', 'column2', 'column3', 'created_at']}
-            SourceRecord(**record_dict)  # Validate with Pydantic
-    except Exception as e:
-        # Cannot fix this row - mark as invalid
-        logger.debug(f"Row {row_index} validation failed: {str(e)}")
-        invalid_rows.append(row_index)
-        is_valid = False
-    
-    return is_valid, cleaned_row if is_valid else None
+def drop_invalid_source_rows(chunk: pd.DataFrame, validation_results: Dict[str, Any]) -> pd.DataFrame:
+    """Remove the rows that broke the source schema in a way transform_chunk can't repair"""
+    from validators import validate_dataframe
+    
+    merged_result = validation_results["validation_details"].get('merged_data', {})
+    error_indices = merged_result.get('error_indices')
+    if not error_indices:
+        return chunk
+    
+    # transform_chunk cleans column3 itself (missing -> 0, absolute value,
+    # capped at 1000), so the failing rows are checked again without it and
+    # only those still failing are dropped. The indices are row labels
+    recheck = validate_dataframe(chunk.loc[error_indices].drop(columns='column3', errors='ignore'))
+    if recheck["valid"]:
+        return chunk
+    unrepairable = recheck.get('error_indices', error_indices)
+    
+    logger.warning(f"Dropping {len(unrepairable)} source rows that failed validation")
+    return chunk.drop(index=unrepairable)
 
-@phase(Phase.TRANSFORM)
-def transform_data_with_pandas(data_dict):
-    """Advanced data transformation using pandas features with validation"""
-    logger.info("Starting data transformation phase")
-    
-    # Get the validation results from the previous phase
-    validation_results = data_dict.get('validation_results', {"valid": False})
+def read_source_chunks() -> Iterator[pd.DataFrame]:
+    """Yield the joined source data chunk by chunk, validating each chunk"""
+    from sqlalchemy import text
+    from validators import validate_source_data
+    
+    # Let the database do the join instead of merging two extracts in pandas.
+    # stream_results uses a server-side cursor, so the driver fetches the
+    # result a chunk at a time instead of buffering all of it client-side
+    with get_source_engine().connect().execution_options(
+        stream_results=True, yield_per=CHUNK_SIZE
+    ) as connection:
+        for chunk in pd.read_sql(text(EXTRACT_QUERY), connection, chunksize=CHUNK_SIZE):
+            # Validate source data using Pydantic and drop the rows that can't be repaired
+            validation_results = validate_source_data({'df_merged': chunk})
+            log_source_validation(validation_results)
+            yield drop_invalid_source_rows(chunk, validation_results)
+
+@phase(Phase.EXTRACT)
+def fetch_data_from_source():
+    """Extract source records joined with their details as a stream of chunks"""
+    logger.info("Starting data extraction phase")
     
-    # Get DataFrames from input
-    df = data_dict['df_merged'] if 'df_merged' in data_dict else data_dict['df_raw']
+    # Chunks are read lazily, so extract, transform and load overlap and
+    # only one chunk has to be held in memory at a time
+    return {
+        'chunks': read_source_chunks()
+    }
+
+def transform_chunk(df: pd.DataFrame, migrated_at: datetime) -> pd.DataFrame:
+    """Advanced data transformation of one chunk using pandas features with validation"""
+    from kernels import clean_and_transform_column3
+    from validators import validate_transformed_data
     
     # Skip processing if DataFrame is empty
     if df.empty:
         logger.warning("Empty DataFrame, skipping transformation")
         return pd.DataFrame()
     
-    # Step 1: Clean and validate the data (row-by-row)
-    invalid_rows = []
-    cleaned_rows = []
+    # Step 1: Clean and validate the data (column-wise)
+    # Rows without the required fields can't be fixed - drop them
+    valid_mask = pd.Series(True, index=df.index)
+    for required in ('id', 'column1'):
+        if required in df.columns:
+            valid_mask &= df[required].notna()
     
-    for i, row in df.iterrows():
-        is_valid, cleaned_row = validate_and_clean_row(row, invalid_rows, i)
-        if is_valid and cleaned_row is not None:
-            cleaned_rows.append(cleaned_row)
+    invalid_rows = df.index[~valid_mask].tolist()
     
     # If we found invalid rows, log them and proceed with valid ones
     if invalid_rows:
         logger.warning(f"Found {len(invalid_rows)} invalid rows that couldn't be fixed")
         logger.debug(f"Invalid row indices: {invalid_rows}")
         
-        # Create a new DataFrame with only the valid, cleaned rows
-        if cleaned_rows:
-            df = pd.DataFrame(cleaned_rows)
-        else:
+        df = df.loc[valid_mask]
+        if df.empty:
             logger.error("No valid rows to process")
             return pd.DataFrame()
     
-    # 1. Basic transformations
-    if 'column3' in df.columns:
-        df['column3_transformed'] = df['column3'] * 2
-    
-    # 2. Handle missing values
-    df = df.fillna({
-        'column2': 'N/A',
-        'column3': 0
-    })
-    
-    # 3. Apply custom function to a column
-    if 'column1' in df.columns:
-        df['column1_upper'] = df['column1'].apply(lambda x: str(x).upper())
-    
-    # 4. Add timestamp column
-    df['migrated_at'] = datetime.now()
-    
-    # 5. Group by and aggregate (if applicable)
-    if 'source_id' in df.columns:
-        df_agg = df.groupby('source_id').agg({
-            'column3': ['sum', 'mean', 'min', 'max'],
-            'detail_data': 'count'
-        }).reset_index()
-        df_agg.columns = ['source_id', 'column3_sum', 'column3_avg', 'column3_min', 'column3_max', 'detail_count']
-        
-        # Add aggregation results back to the main DataFrame
-        df = pd.merge(df, df_agg, on='source_id', how='left')
-    
-    # 6. Apply conditional logic
-    if 'column3' in df.columns:
-        conditions = [
-            (df['column3'] < 10),
-            (df['column3'] >= 10) & (df['column3'] < 50),
-            (df['column3'] >= 50)
-        ]
-        choices = ['low', 'medium', 'high']
-        df['category'] = np.select(conditions, choices, default='unknown')
-    
-    # Select and reorder columns for target table
-    target_columns = [c for c in [
-        'id', 'column1', 'column2', 'column3_transformed', 
-        'migrated_at', 'column1_upper', 'category'
-    ] if c in df.columns]
-    
-    transformed_data = df[target_columns].copy()
+    # Column3 must be a number in [0, 1000] - default, take absolute value and
+    # cap it, then double it, in one compiled pass over the raw array
+    column3_transformed = clean_and_transform_column3(df['column3'].to_numpy(dtype=np.float64))
+    
+    # Build every target column in a single pass instead of adding them to
+    # the source frame one by one and then selecting them again
+    transformed_data = pd.DataFrame({
+        'id': df['id'].to_numpy(),
+        'column1': df['column1'].to_numpy(),
+        # Column2 is optional and low-cardinality - default it and keep it categorical
+        'column2': df['column2'].fillna('N/A').astype('category').array,
+        'column3_transformed': column3_transformed,
+        'migrated_at': migrated_at,
+        'column1_upper': df['column1'].astype('string').str.upper().array,
+        # Buckets are column3 < 10 / < 50 / rest, i.e. twice that on the doubled
+        # values. The conditions are evaluated in order, so each bucket only
+        # needs its upper bound
+        'category': pd.Categorical(
+            np.select([column3_transformed < 20, column3_transformed < 100], ['low', 'medium'], default='high'),
+            categories=CATEGORY_LEVELS
+        )
+    }, index=df.index)
     
     # Validate the transformed data
     transformed_validation = validate_transformed_data(transformed_data)
@@ -255,109 +193,190 @@ def transform_data_with_pandas(data_dict):
             logger.debug(f"Error details: {transformed_validation['error_details']}")
             
             # Example: Remove invalid records if configured to do so
-            if Config.features.get("data_validation", False):
-                # Filter out invalid records
-                transformed_data = transformed_data.drop(transformed_validation['error_indices']).reset_index(drop=True)
+            if config.features.get("data_validation", False):
+                # Filter out invalid records - the indices are row positions,
+                # so mask them out instead of dropping by label and reindexing
+                keep = np.ones(len(transformed_data), dtype=bool)
+                keep[transformed_validation['error_indices']] = False
+                transformed_data = transformed_data.loc[keep]
                 logger.info(f"Removed {len(transformed_validation['error_indices'])} invalid records from result")
     else:
         logger.info(f"Successfully validated {transformed_validation['records_validated']} transformed records")
     
     return transformed_data
 
-@phase(Phase.LOAD)
-def save_data_to_target(transformed_data):
-    """Save data to target database using both pandas and ORM approaches"""
-    logger.info("Starting data loading phase")
-    
-    if transformed_data.empty:
-        logger.warning("No data to save")
-        return {"success": False, "reason": "No data to save"}
+@phase(Phase.TRANSFORM)
+def transform_data_with_pandas(data_dict):
+    """Transform the extracted chunks lazily, one chunk at a time"""
+    logger.info("Starting data transformation phase")
     
-    # Method 1: Using pandas to_sql for bulk insert
+    # One timestamp for the whole run, so every chunk is stamped alike
+    migrated_at = datetime.now()
+    return (transform_chunk(chunk, migrated_at) for chunk in data_dict['chunks'])
+
+def copy_to_table(frame: pd.DataFrame, table_name: str, engine) -> None:
+    """Bulk load a DataFrame into an existing PostgreSQL table with COPY FROM STDIN"""
+    buffer = io.StringIO()
+    frame.to_csv(buffer, index=False, header=False)
+    buffer.seek(0)
+    
+    columns = ", ".join(f'"{column}"' for column in frame.columns)
+    raw_connection = engine.raw_connection()
     try:
-        transformed_data.to_sql('target_table', target_engine, 
-                              if_exists='replace', index=False)
-        logger.info(f"Successfully saved {len(transformed_data)} records via pandas to_sql")
-    except Exception as e:
-        logger.error(f"Error saving data via pandas: {str(e)}")
-        # Continue with ORM approach as fallback
-    
-    # Method 2: Using SQLAlchemy ORM for more control
-    records = transformed_data.to_dict(orient='records')
-    
-    # Create a list to collect any validation errors during load
-    load_errors = []
-    
-    # Validate each record before loading using Pydantic
-    valid_records = []
-    for i, record in enumerate(records):
-        try:
-            # Validate that required fields are present and properly formatted
-            # Here we're using direct field access validation since records are already transformed
-            if 'id' not in record or not isinstance(record['id'], (int, np.integer)):
-                raise ValueError("Missing or invalid ID field")
-            
-            if 'column1' not in record or not isinstance(record['column1'], str):
-                raise ValueError("Missing or invalid column1 field")
-            
-            # If we pass validation, add to valid records
-            valid_records.append(record)
-        except Exception as e:
-            # Record the error but continue processing valid records
-            load_errors.append({"index": i, "error": str(e), "record": record})
+        with raw_connection.cursor() as cursor:
+            cursor.copy_expert(f"COPY {table_name} ({columns}) FROM STDIN WITH (FORMAT csv)", buffer)
+        raw_connection.commit()
+    finally:
+        raw_connection.close()
+
+def bulk_insert(frame: pd.DataFrame, table_name: str, engine) -> None:
+    """Append a DataFrame to an existing table - COPY on PostgreSQL, multi-row INSERTs elsewhere"""
+    if engine.dialect.name == 'postgresql':
+        copy_to_table(frame, table_name, engine)
+    else:
+        frame.to_sql(table_name, engine, if_exists='append', index=False,
+                     method='multi', chunksize=INSERT_BATCH_SIZE)
+
+def create_staging_tables(engine):
+    """(Re)create empty staging copies of the target tables and return their metadata"""
+    from sqlalchemy import Column, MetaData, Table
+    from models import TargetModel, TargetDetailModel
+    
+    # Columns only - no keys or constraints, so a record joined with several
+    # details can be staged more than once
+    metadata = MetaData()
+    for model, name, columns in ((TargetModel, TARGET_STAGING_TABLE, TARGET_COLUMNS),
+                                 (TargetDetailModel, DETAIL_STAGING_TABLE, DETAIL_COLUMNS)):
+        table = model.__table__
+        Table(name, metadata, *(Column(column, table.c[column].type) for column in columns))
+    
+    metadata.drop_all(engine)
+    metadata.create_all(engine)
+    return metadata
+
+def swap_staging_tables(engine) -> None:
+    """Replace the contents of the target tables with the staged rows in one transaction"""
+    from sqlalchemy import text
+    
+    aggregates = ", ".join(f"MIN({column})" for column in TARGET_COLUMNS[1:])
+    detail_columns = ", ".join(DETAIL_COLUMNS)
     
-    if load_errors:
-        logger.warning(f"Found {len(load_errors)} invalid records during load phase")
-        if Config.enable_detailed_logging:
-            logger.debug(f"Load errors: {load_errors}")
+    with engine.begin() as connection:
+        if engine.dialect.name == 'postgresql':
+            # Both tables in one statement, since target_detail references target_table
+            connection.execute(text("TRUNCATE TABLE target_detail, target_table"))
+        else:
+            # TRUNCATE isn't transactional everywhere (MySQL commits implicitly)
+            connection.execute(text("DELETE FROM target_detail"))
+            connection.execute(text("DELETE FROM target_table"))
+        
+        # Collapse the copies of a record staged once per detail row
+        connection.execute(text(
+            f"INSERT INTO target_table ({', '.join(TARGET_COLUMNS)}) "
+            f"SELECT id, {aggregates} FROM {TARGET_STAGING_TABLE} GROUP BY id"
+        ))
+        connection.execute(text(
+            f"INSERT INTO target_detail ({detail_columns}) "
+            f"SELECT {detail_columns} FROM {DETAIL_STAGING_TABLE}"
+        ))
+
+def save_chunk(transformed_data: pd.DataFrame) -> Dict[str, Any]:
+    """Validate one transformed chunk and bulk load it into the staging tables"""
+    target_engine = get_target_engine()
+    
+    # Validate required fields on whole columns before loading anything
+    if 'id' in transformed_data.columns and 'column1' in transformed_data.columns:
+        column1 = transformed_data['column1'].astype('string')
+        valid_mask = (
+            transformed_data['id'].notna()
+            & column1.notna()
+            & (column1.str.len() > 0)
+        )
+    else:
+        valid_mask = pd.Series(False, index=transformed_data.index)
+    
+    load_errors_count = int((~valid_mask).sum())
+    if load_errors_count:
+        logger.warning(f"Found {load_errors_count} invalid records during load phase")
+        if config.enable_detailed_logging:
+            logger.debug(f"Invalid record indices: {transformed_data.index[~valid_mask].tolist()}")
+    
+    valid_data = transformed_data.loc[valid_mask]
+    if not pd.api.types.is_integer_dtype(valid_data['id']):
+        # Dropping rows with missing ids upstream leaves a float column behind
+        valid_data = valid_data.astype({'id': 'int64'})
+    
+    target_rows = valid_data[TARGET_COLUMNS]
+    if 'category' in valid_data.columns:
+        # Create a detail record per target record (as an example)
+        detail_rows = pd.DataFrame({
+            'target_id': valid_data['id'],
+            'detail_data': 'Category: ' + valid_data['category'].astype(str)
+        })
+    else:
+        detail_rows = pd.DataFrame(columns=DETAIL_COLUMNS)
     
     try:
-        with get_session(target_engine) as session:
-            # Clear existing data if needed
-            session.execute(text("TRUNCATE TABLE target_detail"))
-            session.commit()
-            
-            # Create and save target model instances
-            target_instances = []
-            detail_instances = []
-            
-            for record in valid_records:
-                # Create main record
-                target = TargetModel.from_source(record, datetime.now())
-                target_instances.append(target)
-                
-                # Create a detail record (as an example)
-                if 'category' in record:
-                    detail = TargetDetailModel(
-                        detail_data=f"Category: {record['category']}"
-                    )
-                    detail.target = target  # Set relationship
-                    detail_instances.append(detail)
-            
-            # Bulk save
-            session.add_all(target_instances)
-            session.add_all(detail_instances)
-            session.commit()
-            
-            logger.info(f"Successfully saved {len(target_instances)} records and {len(detail_instances)} details via ORM")
-            
+        bulk_insert(target_rows, TARGET_STAGING_TABLE, target_engine)
+        bulk_insert(detail_rows, DETAIL_STAGING_TABLE, target_engine)
+        logger.info(f"Staged {len(target_rows)} records and {len(detail_rows)} details")
     except Exception as e:
-        logger.error(f"Error saving data via ORM: {str(e)}")
+        logger.error(f"Error staging data: {str(e)}")
         return {
             "success": False,
             "error": str(e),
-            "records_processed": len(valid_records),
-            "records_with_errors": len(load_errors)
+            "records_processed": len(target_rows),
+            "records_with_errors": load_errors_count
         }
-        
+    
     return {
         "success": True,
-        "records_processed": len(valid_records),
-        "records_with_errors": len(load_errors),
-        "target_instances": len(target_instances),
-        "detail_instances": len(detail_instances)
+        "records_processed": len(target_rows),
+        "records_with_errors": load_errors_count,
+        "target_instances": len(target_rows),
+        "detail_instances": len(detail_rows)
     }
 
+@phase(Phase.LOAD)
+def save_data_to_target(transformed_chunks):
+    """Stage transformed chunks, then swap them into the target tables in one transaction"""
+    logger.info("Starting data loading phase")
+    
+    target_engine = get_target_engine()
+    staging = create_staging_tables(target_engine)
+    
+    totals = {
+        "records_processed": 0,
+        "records_with_errors": 0,
+        "target_instances": 0,
+        "detail_instances": 0
+    }
+    
+    try:
+        for transformed_data in transformed_chunks:
+            if transformed_data.empty:
+                continue
+            
+            result = save_chunk(transformed_data)
+            
+            for key in totals:
+                totals[key] += result.get(key, 0)
+            
+            # The target tables haven't been touched yet, so they keep their old contents
+            if not result["success"]:
+                return {**totals, "success": False, "error": result["error"]}
+        
+        if not totals["records_processed"]:
+            logger.warning("No data to save")
+            return {"success": False, "reason": "No data to save"}
+        
+        swap_staging_tables(target_engine)
+        logger.info(f"Loaded {totals['records_processed']} records into the target tables")
+    finally:
+        staging.drop_all(target_engine)
+    
+    return {"success": True, **totals}
+
 def run_migration():
     """Execute the entire ETL pipeline"""
     logger.info("Starting migration pipeline")
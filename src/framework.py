@@ -6,10 +6,16 @@ class Phase(Enum):
     TRANSFORM = "Transform"
     LOAD = "Load"
 
+# Module-level phase functions, recorded by @phase and keyed by module name
+_PHASE_REGISTRY = {}
+
 # Modify decorator to accept enum members
 def phase(phase_enum):
     def decorator(func):
         func.phase = phase_enum.value  # Store the string value corresponding to the enum
+        # Record top-level functions so modules don't have to be scanned later
+        if "." not in func.__qualname__:
+            _PHASE_REGISTRY.setdefault(func.__module__, []).append(func)
         return func
     return decorator
 
@@ -22,7 +28,20 @@ class DataMigrationFramework:
             self.phases[func.phase] = func
 
     def register_phases_from_annotations(self, module):
-        # Scan all functions in the module and register phases based on @phase annotations
+        # Use the functions recorded by @phase when the module has any
+        registered = _PHASE_REGISTRY.get(getattr(module, "__name__", None))
+        if registered:
+            for func in registered:
+                self.register_phase(func)
+            # Phase functions imported from other modules are recorded under
+            # their own module, so pick those up from the module namespace
+            for attr_name, attr in sorted(vars(module).items()):
+                if (callable(attr) and hasattr(attr, "phase")
+                        and getattr(attr, "__module__", None) != module.__name__):
+                    self.register_phase(attr)
+            return
+
+        # Otherwise scan all functions in the module and register phases based on @phase annotations
         for attr_name in dir(module):
             attr = getattr(module, attr_name)
             if callable(attr) and hasattr(attr, "phase"):  # Ensure only callable objects are processed
@@ -0,0 +1,85 @@
+"""
+Numeric Kernels
+
+Tight numeric loops used by the migration hot paths. They are compiled with
+Numba when it is installed and fall back to equivalent NumPy expressions
+otherwise, so Numba stays an optional dependency.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional
+    njit = None
+
+
+if njit is not None:
+    # fastmath is left off on purpose: it lets LLVM assume there are no NaNs,
+    # which would drop the isnan() check below
+    @njit(parallel=True, cache=True)
+    def clean_and_transform_column3(column3):
+        """
+        Clean column3 (missing -> 0, absolute value, capped at 1000) and double it.
+
+        Args:
+            column3 (np.ndarray): float64 source values, NaN for missing
+
+        Returns:
+            np.ndarray: Transformed values in [0, 2000]
+        """
+        out = np.empty_like(column3)
+        for i in prange(column3.shape[0]):
+            value = column3[i]
+            if np.isnan(value):
+                value = 0.0
+            elif value < 0.0:
+                value = -value
+            if value > 1000.0:
+                value = 1000.0
+            out[i] = value * 2.0
+        return out
+
+    @njit(parallel=True, cache=True)
+    def column3_transformed_out_of_range(values):
+        """
+        Flag transformed column3 values outside [0, 2000]; NaN is not flagged.
+
+        Args:
+            values (np.ndarray): float64 transformed values
+
+        Returns:
+            np.ndarray: bool mask, True where the value is out of range
+        """
+        out = np.empty(values.shape[0], dtype=np.bool_)
+        for i in prange(values.shape[0]):
+            value = values[i]
+            out[i] = value < 0.0 or value > 2000.0
+        return out
+
+else:
+    def clean_and_transform_column3(column3):
+        """
+        Clean column3 (missing -> 0, absolute value, capped at 1000) and double it.
+
+        Args:
+            column3 (np.ndarray): float64 source values, NaN for missing
+
+        Returns:
+            np.ndarray: Transformed values in [0, 2000]
+        """
+        out = np.abs(np.nan_to_num(column3, nan=0.0))
+        np.minimum(out, 1000.0, out=out)
+        out *= 2.0
+        return out
+
+    def column3_transformed_out_of_range(values):
+        """
+        Flag transformed column3 values outside [0, 2000]; NaN is not flagged.
+
+        Args:
+            values (np.ndarray): float64 transformed values
+
+        Returns:
+            np.ndarray: bool mask, True where the value is out of range
+        """
+        return (values < 0.0) | (values > 2000.0)
@@ -2,6 +2,7 @@ from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, cre
 from sqlalchemy.orm import relationship, sessionmaker, declarative_base, mapped_column, Mapped, DeclarativeBase
 from typing import List, Optional, Dict, Any
 from datetime import datetime
+from functools import lru_cache
 
 # Create base class for SQLAlchemy 2.0
 class Base(DeclarativeBase):
@@ -78,7 +79,12 @@ def init_db(engine) -> None:
     """Initialize database tables"""
     Base.metadata.create_all(engine)
 
+@lru_cache(maxsize=8)
+def get_sessionmaker(engine) -> sessionmaker:
+    """Return the session factory for an engine, building it only once"""
+    # Objects stay readable after commit instead of being re-SELECTed
+    return sessionmaker(bind=engine, expire_on_commit=False)
+
 def get_session(engine):
-    """Create a session factory"""
-    Session = sessionmaker(bind=engine)
-    return Session() 
\ No newline at end of file
+    """Create a session from the engine's cached session factory"""
+    return get_sessionmaker(engine)() 
\ No newline at end of file
@@ -9,8 +9,48 @@ import csv
 import json
 import os
 from datetime import datetime
+import numpy as np
+import pandas as pd
 from framework import phase, Phase, DataMigrationFramework
 
+# Discount rate per product category
+CATEGORY_DISCOUNTS = {
+    "Electronics": 0.10,  # 10% discount
+    "Books": 0.05  # 5% discount
+}
+
+
+def round_cents(amounts):
+    """
+    Round amounts to cents exactly as Python's round(amount, 2) does.
+    
+    Series.round scales by 100 first, and the scaled value can land exactly
+    on a half cent the amount itself is not on (99.50 * 0.91 is stored just
+    above 90.545, but times 100 gives 9054.5, which rounds to even: 90.54).
+    The rounding error of that scaling is recovered exactly (Dekker's two-
+    product; 100 has few enough bits that the partial products are exact),
+    and its sign decides such ties. Only true ties are rounded to even.
+    
+    Args:
+        amounts (pd.Series): Amounts to round
+        
+    Returns:
+        pd.Series: Rounded amounts, same index
+    """
+    values = amounts.to_numpy(dtype=np.float64)
+    scaled = values * 100.0
+    # Split every value into a high and a low half, so that value * 100
+    # equals scaled + error exactly
+    split = values * 134217729.0  # 2**27 + 1
+    high = split - (split - values)
+    low = values - high
+    error = (high * 100.0 - scaled) + low * 100.0
+    
+    tie = np.abs(scaled - np.floor(scaled)) == 0.5
+    cents = np.where(tie & (error > 0), np.ceil(scaled),
+                     np.where(tie & (error < 0), np.floor(scaled), np.rint(scaled)))
+    return pd.Series(cents / 100.0, index=amounts.index)
+
 
 @phase(Phase.EXTRACT)
 def extract_from_csv():
@@ -34,12 +74,12 @@ def extract_from_csv():
     
     # Optionally, write to CSV for demonstration
     with open('source_data.csv', 'w', newline='') as csvfile:
-        fieldnames = ['id', 'name', 'category', 'price', 'in_stock']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        fieldnames = ('id', 'name', 'category', 'price', 'in_stock')
+        writer = csv.writer(csvfile)
         
-        writer.writeheader()
-        for row in source_data:
-            writer.writerow(row)
+        # Plain tuples - no per-cell dict lookups as with DictWriter
+        writer.writerow(fieldnames)
+        writer.writerows(tuple(row[field] for field in fieldnames) for row in source_data)
     
     print(f"Extracted {len(source_data)} records")
     return source_data
@@ -58,35 +98,30 @@ def transform_data(source_data):
     """
     print("Transforming data...")
     
-    transformed_data = []
-    
-    # Process each record
-    for item in source_data:
-        # Create a new transformed record
-        transformed_item = {
-            "product_id": item["id"],
-            "product_name": item["name"].upper(),  # Convert name to uppercase
-            "category": item["category"],
-            "price_usd": item["price"],
-            "price_eur": round(item["price"] * 0.91, 2),  # Convert to EUR
-            "availability": "In Stock" if item["in_stock"] else "Out of Stock",
-            "processed_at": datetime.now().isoformat()
-        }
-        
-        # Add discount information for specific categories
-        if item["category"] == "Electronics":
-            transformed_item["discount"] = 0.10  # 10% discount
-        elif item["category"] == "Books":
-            transformed_item["discount"] = 0.05  # 5% discount
-        else:
-            transformed_item["discount"] = 0.00  # No discount
-        
+    if not source_data:
+        print("Transformed 0 records")
+        return []
+    
+    # Work on whole columns instead of one record at a time
+    df = pd.DataFrame(source_data)
+    
+    # Add discount information for specific categories (no discount otherwise)
+    discount = df["category"].map(CATEGORY_DISCOUNTS).fillna(0.0)
+    
+    transformed = pd.DataFrame({
+        "product_id": df["id"],
+        "product_name": df["name"].str.upper(),  # Convert name to uppercase
+        "category": df["category"],
+        "price_usd": df["price"],
+        "price_eur": round_cents(df["price"] * 0.91),  # Convert to EUR
+        "availability": np.where(df["in_stock"], "In Stock", "Out of Stock"),
+        "processed_at": datetime.now().isoformat(),  # One timestamp for the whole batch
+        "discount": discount,
         # Calculate discounted prices
-        transformed_item["discounted_price_usd"] = round(
-            item["price"] * (1 - transformed_item["discount"]), 2
-        )
-        
-        transformed_data.append(transformed_item)
+        "discounted_price_usd": round_cents(df["price"] * (1 - discount))
+    })
+    
+    transformed_data = transformed.to_dict(orient="records")
     
     print(f"Transformed {len(transformed_data)} records")
     return transformed_data
@@ -114,15 +149,16 @@ def load_to_json(transformed_data):
         categories[category].append(item)
     
     # Save to a single JSON file with all data
-    with open('target_data.json', 'w') as json_file:
-        json.dump(transformed_data, json_file, indent=2)
+    # Output is machine-consumed, so write compact JSON rather than pretty-printing
+    with open('target_data.json', 'w', encoding='utf-8') as json_file:
+        json.dump(transformed_data, json_file, separators=(',', ':'), ensure_ascii=False)
     
     # Save separate JSON files for each category
     os.makedirs('target_data', exist_ok=True)
     for category, items in categories.items():
         filename = f"target_data/{category.lower()}.json"
-        with open(filename, 'w') as json_file:
-            json.dump(items, json_file, indent=2)
+        with open(filename, 'w', encoding='utf-8') as json_file:
+            json.dump(items, json_file, separators=(',', ':'), ensure_ascii=False)
     
     # Return a summary of the operation
     summary = {
@@ -4,13 +4,304 @@ Multi-Source Data Migration Example
 This module demonstrates how to use the migration framework to handle multiple data sources
 and target formats without using complex ORMs or validation libraries.
 """
-import csv
 import json
+import logging
 import os
-import xml.etree.ElementTree as ET
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, suppress
 from datetime import datetime
+from html import escape
+from itertools import chain
+from xml.etree.ElementTree import iterparse
+from xml.sax.saxutils import XMLGenerator, escape as xml_escape, quoteattr
+
+import numpy as np
+import pandas as pd
+
 from framework import phase, Phase, DataMigrationFramework
 
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+logger = logging.getLogger("simple_multi_source")
+
+# Source columns renamed to the field names used in the detailed orders
+CUSTOMER_FIELDS = {"id": "customer_id", "name": "customer_name",
+                   "email": "customer_email", "country": "customer_country"}
+PRODUCT_FIELDS = {"name": "product_name", "category": "product_category", "price": "unit_price"}
+ORDER_FIELDS = {"date": "order_date", "total": "total_amount"}
+
+# Columns of each source, so an empty source still has them
+CUSTOMER_SOURCE_COLUMNS = ["id", "name", "email", "country"]
+PRODUCT_SOURCE_COLUMNS = ["product_id", "name", "category", "price"]
+ORDER_SOURCE_COLUMNS = ["order_id", "customer_id", "products", "total", "date"]
+
+ORDER_COLUMNS = ["order_id", "order_date", "total_amount",
+                 "customer_name", "customer_email", "customer_country"]
+ITEM_COLUMNS = ["product_id", "product_name", "product_category", "unit_price"]
+
+# Integer keys spanning at most this many slots per row are looked up in a
+# direct-address array instead of a hash table
+DENSE_KEY_FACTOR = 4
+
+# Types of the products.xml fields that aren't plain text
+PRODUCT_FIELD_TYPES = {"product_id": int, "price": float}
+
+# Product popularity report, written as head, one HTML_ROW per product, tail
+HTML_HEAD = """
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>Product Popularity Report</title>
+        <style>
+            body { font-family: Arial, sans-serif; margin: 20px; }
+            table { border-collapse: collapse; width: 100%%; }
+            th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+            th { background-color: #f2f2f2; }
+            tr:nth-child(even) { background-color: #f9f9f9; }
+        </style>
+    </head>
+    <body>
+        <h1>Product Popularity Report</h1>
+        <p>Generated on: %s</p>
+        <table>
+            <tr>
+                <th>Product ID</th>
+                <th>Product Name</th>
+                <th>Category</th>
+                <th>Order Count</th>
+                <th>Total Revenue</th>
+            </tr>
+            """
+HTML_ROW = """
+        <tr>
+            <td>{product_id}</td>
+            <td>{product_name}</td>
+            <td>{product_category}</td>
+            <td>{order_count}</td>
+            <td>${total_revenue:.2f}</td>
+        </tr>
+"""
+HTML_TAIL = """
+        </table>
+    </body>
+    </html>
+    """
+
+
+def _dense_slots(keys):
+    """
+    Build a direct-address table for unique, densely packed integer keys.
+    
+    Args:
+        keys (np.ndarray): Join keys of the build side
+        
+    Returns:
+        tuple: (lowest key, array of row positions indexed by key - lowest key,
+            -1 for unused slots), or None when the keys don't qualify
+    """
+    if keys.dtype.kind not in "iu" or len(keys) == 0:
+        return None
+    
+    low = int(keys.min())
+    span = int(keys.max()) - low + 1
+    if span > DENSE_KEY_FACTOR * len(keys):
+        return None
+    
+    slots = np.full(span, -1, dtype=np.intp)
+    slots[keys - low] = np.arange(len(keys))
+    if np.count_nonzero(slots >= 0) != len(keys):
+        # Duplicate keys - a row can't be addressed by its key alone
+        return None
+    return low, slots
+
+
+def _inner_join(left, right, key):
+    """
+    Inner-join two DataFrames on a key column, keeping the row order of left.
+    
+    When right has unique, densely packed integer keys, each left row finds
+    its match through an array indexed by key instead of a hash table;
+    otherwise this is a plain left.merge(right). The result holds left's
+    columns followed by right's other columns, so the two frames must not
+    share any column name besides the key (the direct lookup would not add
+    the _x/_y suffixes merge does).
+    
+    Args:
+        left (pd.DataFrame): Frame whose row order is kept
+        right (pd.DataFrame): Frame joined onto it
+        key (str): Name of the join column in both frames
+        
+    Returns:
+        pd.DataFrame: Rows of left that have a match in right, with right's columns
+    """
+    # Offsets are only computed for integer keys; a float column (a key
+    # holding None/NaN) goes through merge, which just leaves NaN unmatched
+    dense = None
+    if left[key].dtype.kind in "iu":
+        dense = _dense_slots(right[key].to_numpy())
+    if dense is None:
+        return left.merge(right, on=key, how="inner", sort=False)
+    
+    # Small dense integer keys (IDs like 1..N) index straight into an
+    # array of row positions - no hashing at all
+    low, slots = dense
+    offsets = left[key].to_numpy() - low
+    in_range = (offsets >= 0) & (offsets < len(slots))
+    matches = np.full(len(left), -1, dtype=np.intp)
+    matches[in_range] = slots[offsets[in_range]]
+    matched = matches >= 0
+    return pd.concat([
+        left.iloc[matched].reset_index(drop=True),
+        right.drop(columns=key).iloc[matches[matched]].reset_index(drop=True)
+    ], axis=1)
+
+
+@contextmanager
+def atomic_write(path, mode="w", **kwargs):
+    """
+    Open a temporary file for writing and move it over path once complete.
+    
+    The rename is atomic, so readers see either the previous file or the new
+    one, never a partially written file. The temporary file is removed if
+    writing fails.
+    
+    Args:
+        path (str): File to write
+        mode (str): open() mode, "w" or "wb"
+        **kwargs: Other open() arguments, such as encoding
+        
+    Yields:
+        file: The open temporary file
+    """
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    try:
+        with open(tmp_path, mode, **kwargs) as tmpfile:
+            yield tmpfile
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.remove(tmp_path)
+        raise
+
+
+def _write_json(path, data):
+    """
+    Write data to a file as JSON indented by two spaces.
+    
+    Uses orjson's C serializer when it is installed and falls back to the
+    standard library otherwise.
+    
+    Args:
+        path (str): File to write
+        data: JSON-serializable data
+    """
+    if orjson is not None:
+        with atomic_write(path, "wb") as jsonfile:
+            jsonfile.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with atomic_write(path) as jsonfile:
+            json.dump(data, jsonfile, indent=2)
+
+
+def _write_json_array(path, records):
+    """
+    Stream a list of records to a file as a JSON array, one record per line.
+    
+    Each record is encoded and written on its own (with orjson when it is
+    installed), so no buffer for the whole document is ever built.
+    
+    Args:
+        path (str): File to write
+        records (list): JSON-serializable records
+    """
+    if orjson is not None:
+        encode = orjson.dumps
+    else:
+        def encode(record):
+            return json.dumps(record, separators=(",", ":")).encode("utf-8")
+    
+    with atomic_write(path, "wb") as jsonfile:
+        jsonfile.write(b"[")
+        separator = b"\n"
+        for record in records:
+            jsonfile.write(separator)
+            jsonfile.write(encode(record))
+            separator = b",\n"
+        jsonfile.write(b"\n]\n")
+
+
+def _write_csv(path, frame, **kwargs):
+    """
+    Write a DataFrame to a CSV file.
+    
+    Args:
+        path (str): File to write
+        frame (pd.DataFrame): Data to write
+        **kwargs: Other DataFrame.to_csv arguments
+    """
+    with atomic_write(path, newline="") as csvfile:
+        frame.to_csv(csvfile, **kwargs)
+
+
+def _write_xml_records(path, root_tag, record_tag, records):
+    """
+    Stream records to an XML file, one child element per field.
+    
+    The document is written as it is generated, so no element tree is built.
+    
+    Args:
+        path (str): File to write
+        root_tag (str): Tag of the document element
+        record_tag (str): Tag of the element wrapping each record
+        records (list): Dictionaries whose keys become the field tags
+    """
+    with atomic_write(path, encoding="utf-8") as xmlfile:
+        xml = XMLGenerator(xmlfile, encoding="utf-8", short_empty_elements=True)
+        xml.startDocument()
+        xml.startElement(root_tag, {})
+        for record in records:
+            xml.startElement(record_tag, {})
+            for key, value in record.items():
+                xml.startElement(key, {})
+                if value is not None:
+                    # None is left as an empty element, which reads back as None
+                    xml.characters(str(value))
+                xml.endElement(key)
+            xml.endElement(record_tag)
+        xml.endElement(root_tag)
+        xml.endDocument()
+
+
+def _iter_products_xml(path):
+    """
+    Stream the products of a products.xml file as dictionaries.
+    
+    Each product element is discarded once it has been converted, so memory
+    use stays flat no matter how large the file is.
+    
+    Args:
+        path (str): products.xml file to read
+        
+    Yields:
+        dict: One product, with its fields converted to their Python types
+    """
+    events = iterparse(path, events=("start", "end"))
+    _, root = next(events)
+    for event, elem in events:
+        if event == "end" and elem.tag == "product":
+            # An empty element (no text at all) is a missing value
+            yield {
+                child.tag: (None if child.text is None
+                            else PRODUCT_FIELD_TYPES.get(child.tag, str)(child.text))
+                for child in elem
+            }
+            # Drop the finished product from the (otherwise growing) root
+            root.clear()
+
 
 @phase(Phase.EXTRACT)
 def extract_from_multiple_sources():
@@ -46,29 +337,18 @@ def extract_from_multiple_sources():
         {"product_id": 105, "name": "External Drive", "category": "Electronics", "price": 64.99}
     ]
     
-    # Write sample files for demonstration
-    # CSV file
-    with open('customers.csv', 'w', newline='') as csvfile:
-        fieldnames = ['id', 'name', 'email', 'country']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        for customer in customers_data:
-            writer.writerow(customer)
-    
-    # JSON file
-    with open('orders.json', 'w') as jsonfile:
-        json.dump(orders_data, jsonfile, indent=2)
-    
-    # XML file
-    root = ET.Element("products")
-    for product in products_data:
-        product_elem = ET.SubElement(root, "product")
-        for key, value in product.items():
-            elem = ET.SubElement(product_elem, key)
-            elem.text = str(value)
-    
-    tree = ET.ElementTree(root)
-    tree.write("products.xml")
+    # Write sample files for demonstration - CSV, JSON and XML files are
+    # independent, so they are written concurrently
+    customers_df = pd.DataFrame(customers_data, columns=['id', 'name', 'email', 'country'])
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        writes = [
+            executor.submit(_write_csv, 'customers.csv', customers_df, index=False),
+            executor.submit(_write_json, 'orders.json', orders_data),
+            executor.submit(_write_xml_records, "products.xml", "products", "product", products_data)
+        ]
+        # Re-raise the first failed write, if any
+        for write in writes:
+            write.result()
     
     # Combine all data into a single dictionary
     extracted_data = {
@@ -85,95 +365,118 @@ def extract_from_multiple_sources():
     return extracted_data
 
 
+def _join_sources(extracted_data):
+    """
+    Join orders with their customers and ordered products with their details.
+    
+    Args:
+        extracted_data (dict): Dictionary with data from different sources
+        
+    Returns:
+        tuple: (orders, items) DataFrames - one row per order with its customer
+            fields, and one row per ordered product with its product fields
+    """
+    customers_df = (pd.DataFrame(extracted_data["customers"], columns=CUSTOMER_SOURCE_COLUMNS)
+                    .rename(columns=CUSTOMER_FIELDS))
+    products_df = (pd.DataFrame(extracted_data["products"], columns=PRODUCT_SOURCE_COLUMNS)
+                   .rename(columns=PRODUCT_FIELDS))
+    orders_df = (pd.DataFrame(extracted_data["orders"], columns=ORDER_SOURCE_COLUMNS)
+                 .rename(columns=ORDER_FIELDS))
+    
+    # Join every order with its customer - the inner join drops orders of
+    # unknown customers, so they are only looked for when they get reported
+    if logger.isEnabledFor(logging.WARNING):
+        missing_customer = ~orders_df["customer_id"].isin(customers_df["customer_id"])
+        if missing_customer.any():
+            logger.warning("Customer not found for orders: %s",
+                           orders_df.loc[missing_customer, "order_id"].tolist())
+    orders_df = _inner_join(orders_df, customers_df, "customer_id")
+    
+    # One row per ordered product, joined with the product details. The
+    # product lists are flattened into one array and each order ID repeated
+    # once per product, instead of exploding the list column row by row
+    product_lists = orders_df["products"].tolist()
+    counts = np.fromiter(map(len, product_lists), dtype=np.intp, count=len(product_lists))
+    product_id_dtype = products_df["product_id"].dtype
+    try:
+        product_ids = np.fromiter(chain.from_iterable(product_lists),
+                                  dtype=product_id_dtype, count=int(counts.sum()))
+    except (TypeError, ValueError):
+        # A None or non-numeric product ID - keep the IDs as Python objects
+        product_ids = np.array(list(chain.from_iterable(product_lists)), dtype=object)
+    items_df = pd.DataFrame({
+        "order_id": np.repeat(orders_df["order_id"].to_numpy(), counts),
+        "product_id": product_ids
+    })
+    
+    if logger.isEnabledFor(logging.WARNING):
+        missing_product = ~items_df["product_id"].isin(products_df["product_id"])
+        if missing_product.any():
+            logger.warning("Products not found (order, product): %s",
+                           list(items_df.loc[missing_product, ["order_id", "product_id"]]
+                                .itertuples(index=False, name=None)))
+    if product_ids.dtype == object:
+        # The unusable IDs have no product anyway; drop them so the rest
+        # join on the same integer dtype as the products
+        items_df = items_df[items_df["product_id"].isin(products_df["product_id"])]
+        items_df = items_df.astype({"product_id": product_id_dtype}).reset_index(drop=True)
+    items_df = _inner_join(items_df, products_df, "product_id")
+    
+    return orders_df.drop(columns="products"), items_df
+
+
 @phase(Phase.TRANSFORM)
 def transform_and_join_data(extracted_data):
     """
     Transform phase: Process and join data from multiple sources.
     
     Args:
-        extracted_data (dict): Dictionary with data from different sources
+        extracted_data (dict): Dictionary with data from different sources,
+            emptied once the sources have been joined
         
     Returns:
         dict: Transformed and joined data
     """
     print("Transforming and joining data...")
     
-    customers = {c["id"]: c for c in extracted_data["customers"]}
-    products = {p["product_id"]: p for p in extracted_data["products"]}
-    orders = extracted_data["orders"]
-    
-    # Create detailed order reports with customer and product information
-    detailed_orders = []
+    orders_df, items_df = _join_sources(extracted_data)
     
-    for order in orders:
-        customer = customers.get(order["customer_id"])
-        
-        if not customer:
-            print(f"Warning: Customer not found for order {order['order_id']}")
-            continue
-        
-        # Create a detailed order with customer information
-        detailed_order = {
-            "order_id": order["order_id"],
-            "order_date": order["date"],
-            "total_amount": order["total"],
-            "customer_name": customer["name"],
-            "customer_email": customer["email"],
-            "customer_country": customer["country"],
-            "items": []
-        }
-        
-        # Add product details
-        for product_id in order["products"]:
-            product = products.get(product_id)
-            
-            if product:
-                item = {
-                    "product_id": product["product_id"],
-                    "product_name": product["name"],
-                    "product_category": product["category"],
-                    "unit_price": product["price"]
-                }
-                detailed_order["items"].append(item)
-            else:
-                print(f"Warning: Product {product_id} not found for order {order['order_id']}")
-        
-        detailed_orders.append(detailed_order)
+    # The source records aren't needed past the join. Drop them from the
+    # phase input so they don't stay alive next to the detailed orders
+    extracted_data.clear()
     
     # Generate sales by country report
-    sales_by_country = {}
-    for order in detailed_orders:
-        country = order["customer_country"]
-        if country not in sales_by_country:
-            sales_by_country[country] = {
-                "total_sales": 0,
-                "order_count": 0,
-                "customer_count": set()
-            }
-        
-        sales_by_country[country]["total_sales"] += order["total_amount"]
-        sales_by_country[country]["order_count"] += 1
-        sales_by_country[country]["customer_count"].add(order["customer_name"])
-    
-    # Convert sets to counts for JSON serialization
-    for country in sales_by_country:
-        sales_by_country[country]["customer_count"] = len(sales_by_country[country]["customer_count"])
+    sales_by_country = (
+        orders_df.groupby("customer_country", sort=False)
+        .agg(total_sales=("total_amount", "sum"),
+             order_count=("order_id", "size"),
+             customer_count=("customer_name", "nunique"))
+        .to_dict(orient="index")
+    )
     
     # Generate product popularity report
-    product_popularity = {}
-    for order in detailed_orders:
-        for item in order["items"]:
-            product_id = item["product_id"]
-            if product_id not in product_popularity:
-                product_popularity[product_id] = {
-                    "product_name": item["product_name"],
-                    "product_category": item["product_category"],
-                    "order_count": 0,
-                    "total_revenue": 0
-                }
-            
-            product_popularity[product_id]["order_count"] += 1
-            product_popularity[product_id]["total_revenue"] += item["unit_price"]
+    product_popularity = (
+        items_df.groupby("product_id", sort=False)
+        .agg(product_name=("product_name", "first"),
+             product_category=("product_category", "first"),
+             order_count=("order_id", "size"),
+             total_revenue=("unit_price", "sum"))
+        .to_dict(orient="index")
+    )
+    
+    # Create detailed order reports with customer and product information,
+    # releasing each joined frame as soon as it has been converted
+    items_by_order = {}
+    for order_id, item in zip(items_df["order_id"].tolist(),
+                              items_df[ITEM_COLUMNS].to_dict(orient="records")):
+        items_by_order.setdefault(order_id, []).append(item)
+    del items_df
+    
+    detailed_orders = orders_df[ORDER_COLUMNS].to_dict(orient="records")
+    del orders_df
+    for detailed_order in detailed_orders:
+        detailed_order["items"] = items_by_order.get(detailed_order["order_id"], [])
+    del items_by_order
     
     transformed_data = {
         "detailed_orders": detailed_orders,
@@ -189,6 +492,62 @@ def transform_and_join_data(extracted_data):
     return transformed_data
 
 
+def _write_popularity_html(path, product_popularity, generated_on):
+    """
+    Write the product popularity report as an HTML table.
+    
+    Args:
+        path (str): File to write
+        product_popularity (dict): Report rows keyed by product ID
+        generated_on (datetime): Time shown in the report header
+    """
+    with atomic_write(path) as htmlfile:
+        htmlfile.write(HTML_HEAD % generated_on.strftime("%Y-%m-%d %H:%M:%S"))
+        # Rows go straight to the file, with the text fields escaped for HTML
+        htmlfile.writelines(
+            HTML_ROW.format(
+                product_id=product_id,
+                product_name=escape(data['product_name']),
+                product_category=escape(data['product_category']),
+                order_count=data['order_count'],
+                total_revenue=data['total_revenue']
+            )
+            for product_id, data in product_popularity.items()
+        )
+        htmlfile.write(HTML_TAIL)
+
+
+def _write_summary_xml(path, timestamp, sources, outputs):
+    """
+    Write the migration summary as XML.
+    
+    Args:
+        path (str): File to write
+        timestamp (str): ISO timestamp of the load
+        sources (list): (name, format) of every source
+        outputs (list): (name, format, record_count) of every output file
+    """
+    # The document has a fixed shape, so it is rendered from one template
+    # instead of going through an XML writer
+    source_elements = "".join(
+        f'<source name={quoteattr(name)} format={quoteattr(file_format)}/>'
+        for name, file_format in sources
+    )
+    output_elements = "".join(
+        f'<output name={quoteattr(name)} format={quoteattr(file_format)} '
+        f'record_count="{record_count}"/>'
+        for name, file_format, record_count in outputs
+    )
+    with atomic_write(path, encoding="utf-8") as xmlfile:
+        xmlfile.write(
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            f'<migration_summary><timestamp>{xml_escape(timestamp)}</timestamp>'
+            f'<sources count="{len(sources)}">{source_elements}</sources>'
+            f'<outputs count="{len(outputs)}">{output_elements}</outputs>'
+            '</migration_summary>'
+        )
+
+
 @phase(Phase.LOAD)
 def load_to_multiple_formats(transformed_data):
     """
@@ -202,122 +561,46 @@ def load_to_multiple_formats(transformed_data):
     """
     print("Loading data to multiple formats...")
     
+    # One timestamp for every file written by this load
+    now = datetime.now()
+    timestamp = now.isoformat()
+    
     # Create output directory
     os.makedirs("output", exist_ok=True)
     
-    # 1. Save detailed orders as JSON
-    with open("output/detailed_orders.json", "w") as jsonfile:
-        json.dump(transformed_data["detailed_orders"], jsonfile, indent=2)
-    
-    # 2. Save sales by country as CSV
-    with open("output/sales_by_country.csv", "w", newline="") as csvfile:
-        fieldnames = ["country", "total_sales", "order_count", "customer_count"]
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        for country, data in transformed_data["sales_by_country"].items():
-            row = {
-                "country": country,
-                "total_sales": data["total_sales"],
-                "order_count": data["order_count"],
-                "customer_count": data["customer_count"]
-            }
-            writer.writerow(row)
-    
-    # 3. Save product popularity as HTML
-    html_content = """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Product Popularity Report</title>
-        <style>
-            body { font-family: Arial, sans-serif; margin: 20px; }
-            table { border-collapse: collapse; width: 100%; }
-            th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
-            th { background-color: #f2f2f2; }
-            tr:nth-child(even) { background-color: #f9f9f9; }
-        </style>
-    </head>
-    <body>
-        <h1>Product Popularity Report</h1>
-        <p>Generated on: %s</p>
-        <table>
-            <tr>
-                <th>Product ID</th>
-                <th>Product Name</th>
-                <th>Category</th>
-                <th>Order Count</th>
-                <th>Total Revenue</th>
-            </tr>
-            %s
-        </table>
-    </body>
-    </html>
-    """ 
-    
-    table_rows = ""
-    for product_id, data in transformed_data["product_popularity"].items():
-        row = f"""
-        <tr>
-            <td>{product_id}</td>
-            <td>{data['product_name']}</td>
-            <td>{data['product_category']}</td>
-            <td>{data['order_count']}</td>
-            <td>${data['total_revenue']:.2f}</td>
-        </tr>
-        """
-        table_rows += row
-    
-    html_content = html_content % (datetime.now().strftime("%Y-%m-%d %H:%M:%S"), table_rows)
-    
-    with open("output/product_popularity.html", "w") as htmlfile:
-        htmlfile.write(html_content)
-    
-    # 4. Create a summary XML file
-    root = ET.Element("migration_summary")
-    
-    timestamp = ET.SubElement(root, "timestamp")
-    timestamp.text = datetime.now().isoformat()
-    
-    sources = ET.SubElement(root, "sources")
-    sources.set("count", "3")
-    
-    source1 = ET.SubElement(sources, "source")
-    source1.set("name", "customers")
-    source1.set("format", "CSV")
-    
-    source2 = ET.SubElement(sources, "source")
-    source2.set("name", "orders")
-    source2.set("format", "JSON")
-    
-    source3 = ET.SubElement(sources, "source")
-    source3.set("name", "products")
-    source3.set("format", "XML")
-    
-    outputs = ET.SubElement(root, "outputs")
-    outputs.set("count", "3")
-    
-    output1 = ET.SubElement(outputs, "output")
-    output1.set("name", "detailed_orders.json")
-    output1.set("format", "JSON")
-    output1.set("record_count", str(len(transformed_data["detailed_orders"])))
-    
-    output2 = ET.SubElement(outputs, "output")
-    output2.set("name", "sales_by_country.csv")
-    output2.set("format", "CSV")
-    output2.set("record_count", str(len(transformed_data["sales_by_country"])))
-    
-    output3 = ET.SubElement(outputs, "output")
-    output3.set("name", "product_popularity.html")
-    output3.set("format", "HTML")
-    output3.set("record_count", str(len(transformed_data["product_popularity"])))
+    sales_by_country = pd.DataFrame.from_dict(
+        transformed_data["sales_by_country"], orient="index",
+        columns=["total_sales", "order_count", "customer_count"]
+    )
+    
+    # Sources and outputs listed in the summary XML
+    sources = [("customers", "CSV"), ("orders", "JSON"), ("products", "XML")]
+    outputs = [
+        ("detailed_orders.json", "JSON", len(transformed_data["detailed_orders"])),
+        ("sales_by_country.csv", "CSV", len(transformed_data["sales_by_country"])),
+        ("product_popularity.html", "HTML", len(transformed_data["product_popularity"]))
+    ]
     
-    tree = ET.ElementTree(root)
-    tree.write("output/summary.xml")
+    # The four files are independent, so their writes overlap on threads:
+    # 1. detailed orders as JSON, 2. sales by country as CSV,
+    # 3. product popularity as HTML and 4. a summary XML file
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        writes = [
+            executor.submit(_write_json_array, "output/detailed_orders.json",
+                            transformed_data["detailed_orders"]),
+            executor.submit(_write_csv, "output/sales_by_country.csv", sales_by_country,
+                            index_label="country"),
+            executor.submit(_write_popularity_html, "output/product_popularity.html",
+                            transformed_data["product_popularity"], now),
+            executor.submit(_write_summary_xml, "output/summary.xml", timestamp, sources, outputs)
+        ]
+        # Re-raise the first failed write, if any
+        for write in writes:
+            write.result()
     
     # Create a summary of the operation
     summary = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": timestamp,
         "sources": [
             {"name": "customers", "format": "CSV"},
             {"name": "orders", "format": "JSON"},
@@ -338,18 +621,16 @@ def load_to_multiple_formats(transformed_data):
     return summary
 
 
+# Create the framework and register this module's phases once, at import,
+# instead of on every run
+framework = DataMigrationFramework()
+framework.register_phases_from_annotations(sys.modules[__name__])
+
+
 def run_multi_source_migration():
     """
     Run the multi-source data migration process.
     """
-    # Create an instance of the framework
-    framework = DataMigrationFramework()
-    
-    # Register the current module
-    import sys
-    current_module = sys.modules[__name__]
-    framework.register_phases_from_annotations(current_module)
-    
     # Execute the migration process
     print("\n===== STARTING MULTI-SOURCE DATA MIGRATION =====\n")
     result = framework.run()
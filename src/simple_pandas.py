@@ -6,12 +6,30 @@ for data processing without relying on SQLAlchemy or Pydantic.
 """
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib
+matplotlib.use("Agg")  # Charts are only saved to files; skip GUI backend discovery
+from matplotlib.figure import Figure
 import seaborn as sns
+import hashlib
+import json
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from framework import phase, Phase, DataMigrationFramework
 
+try:
+    import bottleneck as bn
+except ImportError:  # Bottleneck is optional, moving averages fall back to running sums
+    bn = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional, all outputs fall back to DataFrame.to_csv
+    pacsv = None
+
 # Ensure output directories exist
 os.makedirs("output", exist_ok=True)
 os.makedirs("output/data", exist_ok=True)
@@ -19,8 +37,237 @@ os.makedirs("output/visualizations", exist_ok=True)
 
 # Set seaborn style for better visualizations
 sns.set(style="whitegrid")
-plt.rcParams['figure.figsize'] = (12, 8)
-plt.rcParams['font.size'] = 12
+matplotlib.rcParams['figure.figsize'] = (12, 8)
+matplotlib.rcParams['font.size'] = 12
+# Pin the bundled font so text layout never falls back to a system font scan
+matplotlib.rcParams['font.family'] = 'DejaVu Sans'
+
+# Output files are written through 1 MiB buffers to cut down on write syscalls
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Content hashes of the tables in output/data, so unchanged tables aren't rewritten
+HASH_CACHE_PATH = "output/data/.hashcache.json"
+
+# Weekday names in calendar order, used as an ordered categorical
+DAY_ORDER = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+
+def write_csv(df, path, index=True):
+    """
+    Write a DataFrame to CSV, through Arrow's multithreaded writer when available.
+    
+    Args:
+        df (pd.DataFrame): DataFrame to write
+        path (str): Output file path
+        index (bool): Whether to write the index as the leading column(s)
+    """
+    table = None
+    if pacsv is not None:
+        if index:
+            df = df.reset_index()
+            index = False
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Object columns mixing Python types (e.g. strings and numbers in one
+            # column) have no single Arrow type; pandas writes them as they are
+            pass
+    
+    if table is None:
+        with open(path, "w", newline="", buffering=WRITE_BUFFER_SIZE) as file:
+            df.to_csv(file, index=index)
+    else:
+        with pa.output_stream(path, buffer_size=WRITE_BUFFER_SIZE) as sink:
+            pacsv.write_csv(table, sink)
+
+def moving_average(series, window):
+    """
+    Trailing moving average, NaN until a full window is available.
+    
+    Without Bottleneck this uses running-sum differences, which assumes the
+    series has no missing values (true for the generated sales columns).
+    
+    Args:
+        series (pd.Series): Values to average
+        window (int): Window length in rows
+        
+    Returns:
+        np.ndarray: Moving average aligned with the input
+    """
+    values = series.to_numpy(dtype=np.float64)
+    if bn is not None:
+        return bn.move_mean(values, window=window, min_count=window)
+    cumulative = np.concatenate(([0.0], np.cumsum(values)))
+    averages = np.full(values.shape, np.nan)
+    averages[window - 1:] = (cumulative[window:] - cumulative[:-window]) / window
+    return averages
+
+def read_hash_cache():
+    """
+    Read the table content hashes recorded by earlier runs.
+    
+    Returns:
+        dict: Table name -> [content hash, path relative to the output directory]
+    """
+    try:
+        with open(HASH_CACHE_PATH) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+def write_hash_cache(hash_cache):
+    """
+    Record the table content hashes for the next run.
+    
+    Args:
+        hash_cache (dict): Table name -> [content hash, relative path]
+    """
+    with open(HASH_CACHE_PATH, "w") as file:
+        json.dump(hash_cache, file, indent=2, sort_keys=True)
+
+def table_hash(df):
+    """
+    Hash a DataFrame's values, index, column names and dtypes.
+    
+    Args:
+        df (pd.DataFrame): DataFrame to hash
+        
+    Returns:
+        str: Hex digest, different whenever the written file would differ
+    """
+    hasher = hashlib.sha256()
+    # The output format is part of the key, so installing pyarrow forces a rewrite
+    hasher.update(repr((pacsv is not None, list(df.columns), df.dtypes.astype(str).tolist(), df.index.names)).encode("utf-8"))
+    hasher.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return hasher.hexdigest()[:16]
+
+def write_table(df, name, hash_cache=None):
+    """
+    Write a DataFrame to output/data as zstd Parquet, or CSV without pyarrow.
+    
+    Args:
+        df (pd.DataFrame): DataFrame to write, index included
+        name (str): Base file name without extension
+        hash_cache (dict): Content hashes from read_hash_cache(); when given,
+            the write is skipped if the file already holds the same table,
+            and the entry is updated after writing
+        
+    Returns:
+        str: Path of the written file relative to the output directory
+    """
+    if hash_cache is not None:
+        digest = table_hash(df)
+        cached = hash_cache.get(name)
+        if cached is not None and cached[0] == digest and os.path.exists(f"output/{cached[1]}"):
+            return cached[1]
+        path = write_table(df, name)
+        hash_cache[name] = [digest, path]
+        return path
+    
+    if pacsv is not None:
+        try:
+            table = pa.Table.from_pandas(df)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            table = None
+        if table is not None:
+            pq.write_table(table, f"output/data/{name}.parquet", compression="zstd", compression_level=3)
+            return f"data/{name}.parquet"
+    write_csv(df, f"output/data/{name}.csv")
+    return f"data/{name}.csv"
+
+
+def render_line_chart(path, x, series, title, xlabel, ylabel):
+    """
+    Render one or more labelled line series against a shared x axis.
+    
+    Args:
+        path (str): Output PNG path
+        x (np.ndarray): Shared x values
+        series (list): (y values, label) pairs
+        title (str): Chart title
+        xlabel (str): X axis label
+        ylabel (str): Y axis label
+    """
+    fig = Figure(figsize=(12, 6))
+    ax = fig.subplots()
+    for y, label in series:
+        sns.lineplot(x=x, y=y, label=label, ax=ax)
+    ax.set_title(title, fontsize=16)
+    ax.set_xlabel(xlabel, fontsize=14)
+    ax.set_ylabel(ylabel, fontsize=14)
+    ax.legend(fontsize=12)
+    fig.tight_layout()
+    fig.savefig(path, dpi=300)
+
+
+def render_bar_chart(path, labels, values, title, xlabel, ylabel, figsize=(8, 5), rotation=None):
+    """
+    Render a bar chart with one bar per label, in the given order.
+    
+    Args:
+        path (str): Output PNG path
+        labels (list): Bar labels
+        values (np.ndarray): Bar heights
+        title (str): Chart title
+        xlabel (str): X axis label
+        ylabel (str): Y axis label
+        figsize (tuple): Figure size in inches
+        rotation (int, optional): X tick label rotation in degrees
+    """
+    fig = Figure(figsize=figsize)
+    ax = fig.subplots()
+    sns.barplot(x=labels, y=values, hue=labels, palette='viridis', legend=False, ax=ax)
+    ax.set_title(title, fontsize=16)
+    ax.set_xlabel(xlabel, fontsize=14)
+    ax.set_ylabel(ylabel, fontsize=14)
+    if rotation is not None:
+        ax.tick_params(axis='x', labelrotation=rotation)
+    fig.tight_layout()
+    fig.savefig(path, dpi=300)
+
+
+def render_heatmap(path, values, index, columns, cmap, fmt, title):
+    """
+    Render an annotated heatmap of a labelled matrix.
+    
+    Args:
+        path (str): Output PNG path
+        values (np.ndarray): 2D matrix
+        index (list): Row labels
+        columns (list): Column labels
+        cmap (str): Matplotlib colormap name
+        fmt (str): Annotation format spec
+        title (str): Chart title
+    """
+    fig = Figure(figsize=(10, 8))
+    ax = fig.subplots()
+    sns.heatmap(pd.DataFrame(values, index=index, columns=columns),
+                annot=True, cmap=cmap, fmt=fmt, linewidths=0.5, ax=ax)
+    ax.set_title(title, fontsize=16)
+    fig.tight_layout()
+    fig.savefig(path, dpi=300)
+
+
+CHART_RENDERERS = {
+    'line': render_line_chart,
+    'bar': render_bar_chart,
+    'heatmap': render_heatmap
+}
+
+
+def render_chart(task):
+    """
+    Render one chart task into output/visualizations; runs in a worker process.
+    
+    Args:
+        task (tuple): (kind, file name, keyword arguments for the renderer)
+        
+    Returns:
+        str: The file name that was written
+    """
+    kind, filename, kwargs = task
+    CHART_RENDERERS[kind](f"output/visualizations/{filename}", **kwargs)
+    return filename
 
 
 @phase(Phase.EXTRACT)
@@ -38,88 +285,83 @@ def extract_data_to_pandas():
     start_date = end_date - timedelta(days=30)
     date_range = pd.date_range(start=start_date, end=end_date, freq='D')
     
-    # Create sample sales data
-    np.random.seed(42)  # For reproducibility
+    # Fixed vocabularies for the product and customer tables
+    products = ['Laptop', 'Smartphone', 'Tablet', 'Headphones', 'Monitor', 'Keyboard', 'Mouse']
+    categories = ['Electronics', 'Electronics', 'Electronics', 'Accessories', 'Accessories', 'Accessories', 'Accessories']
+    customer_segments = ['New', 'Returning', 'Loyal', 'VIP']
+    regions = ['North', 'South', 'East', 'West']
+    n_products = len(products)
+    per_day = len(customer_segments) * len(regions)
+    n_product_rows = len(date_range) * n_products
+    
+    # Create sample sales data. Count columns are small and stored as int16;
+    # money columns stay float64 so cent-rounded values survive CSV output.
+    rng = np.random.default_rng(42)  # For reproducibility
+    
+    # Draw the N(0, 2) noise for both tables at once and slice it below
+    variation = rng.normal(0, 2, size=n_product_rows + len(date_range) * per_day)
     
     # 1. Daily sales data
     daily_sales_data = pd.DataFrame({
         'date': date_range,
-        'revenue': np.random.normal(1000, 200, size=len(date_range)),
-        'transactions': np.random.randint(50, 150, size=len(date_range)),
-        'advertising_spend': np.random.uniform(100, 300, size=len(date_range))
+        'revenue': rng.normal(1000, 200, size=len(date_range)),
+        'transactions': rng.integers(50, 150, size=len(date_range)).astype(np.int16),
+        'advertising_spend': rng.uniform(100, 300, size=len(date_range))
     })
     
-    # 2. Product sales data
-    products = ['Laptop', 'Smartphone', 'Tablet', 'Headphones', 'Monitor', 'Keyboard', 'Mouse']
-    categories = ['Electronics', 'Electronics', 'Electronics', 'Accessories', 'Accessories', 'Accessories', 'Accessories']
+    # 2. Product sales data: one row per (date, product), built column-wise
+    product_dates = np.repeat(date_range.values, n_products)
+    j = np.tile(np.arange(n_products), len(date_range))
     
-    product_sales = []
-    for i, date in enumerate(date_range):
-        for j, product in enumerate(products):
-            # Generate different volumes per product with some randomness
-            base_volume = 10 - j  # Higher for first products
-            if j < 3:  # Make electronic items more popular
-                base_volume += 5
-            
-            # Add day-of-week effect (higher on weekends)
-            weekend_boost = 5 if date.dayofweek >= 5 else 0
-            
-            # Random variation
-            variation = np.random.normal(0, 2)
-            
-            volume = max(0, int(base_volume + weekend_boost + variation))
-            
-            # Price with some random variation
-            base_price = 100 * (j + 1)  # Different price tiers
-            price = round(base_price * np.random.uniform(0.95, 1.05), 2)
-            
-            product_sales.append({
-                'date': date,
-                'product': product,
-                'category': categories[j],
-                'units_sold': volume,
-                'unit_price': price,
-                'total_sales': volume * price
-            })
-    
-    product_sales_data = pd.DataFrame(product_sales)
-    
-    # 3. Customer data
-    customer_segments = ['New', 'Returning', 'Loyal', 'VIP']
-    regions = ['North', 'South', 'East', 'West']
+    # Different volumes per product, electronic items more popular
+    base_volume = np.where(j < 3, 15 - j, 10 - j)
     
-    customer_data = []
-    for i, date in enumerate(date_range):
-        for segment in customer_segments:
-            for region in regions:
-                # Generate different order counts based on segment and region
-                base_orders = {'New': 5, 'Returning': 10, 'Loyal': 15, 'VIP': 20}[segment]
-                region_modifier = {'North': 1.2, 'South': 0.9, 'East': 1.0, 'West': 1.1}[region]
-                
-                # Add time-based trend (growing over time)
-                time_trend = i / len(date_range) * 5
-                
-                # Random variation
-                variation = np.random.normal(0, 2)
-                
-                orders = max(0, int(base_orders * region_modifier + time_trend + variation))
-                avg_order_value = round(50 + (orders / 5) + np.random.normal(0, 5), 2)
-                
-                customer_data.append({
-                    'date': date,
-                    'segment': segment,
-                    'region': region,
-                    'orders': orders,
-                    'avg_order_value': avg_order_value,
-                    'total_value': orders * avg_order_value
-                })
-    
-    customer_segment_data = pd.DataFrame(customer_data)
-    
-    # Save raw data as CSV files
-    daily_sales_data.to_csv("output/data/daily_sales_raw.csv", index=False)
-    product_sales_data.to_csv("output/data/product_sales_raw.csv", index=False)
-    customer_segment_data.to_csv("output/data/customer_segment_raw.csv", index=False)
+    # Day-of-week effect (higher on weekends)
+    weekend_boost = np.where(np.repeat(date_range.dayofweek >= 5, n_products), 5, 0)
+    
+    # Random variation
+    volume = np.maximum(0, (base_volume + weekend_boost + variation[:n_product_rows]).astype(int))
+    
+    # Price tiers with some random variation
+    price = np.round(100 * (j + 1) * rng.uniform(0.95, 1.05, size=len(j)), 2)
+    
+    product_sales_data = pd.DataFrame({
+        'date': product_dates,
+        'product': pd.Categorical.from_codes(j, categories=products),
+        'category': pd.Categorical(np.tile(categories, len(date_range))),
+        'units_sold': volume.astype(np.int16),
+        'unit_price': price,
+        'total_sales': volume * price
+    })
+    
+    # 3. Customer data: one row per (date, segment, region)
+    base_orders = np.array([5, 10, 15, 20])
+    region_modifier = np.array([1.2, 0.9, 1.0, 1.1])
+    
+    day_index = np.repeat(np.arange(len(date_range)), per_day)
+    segment_index = np.tile(np.repeat(np.arange(len(customer_segments)), len(regions)), len(date_range))
+    region_index = np.tile(np.arange(len(regions)), len(date_range) * len(customer_segments))
+    
+    # Time-based trend (growing over time) plus random variation
+    time_trend = day_index / len(date_range) * 5
+    orders = np.maximum(0, (base_orders[segment_index] * region_modifier[region_index] + time_trend + variation[n_product_rows:]).astype(int))
+    avg_order_value = np.round(50 + (orders / 5) + rng.normal(0, 5, size=len(orders)), 2)
+    
+    customer_segment_data = pd.DataFrame({
+        'date': date_range.values[day_index],
+        'segment': pd.Categorical.from_codes(segment_index, categories=customer_segments),
+        'region': pd.Categorical.from_codes(region_index, categories=regions),
+        'orders': orders.astype(np.int16),
+        'avg_order_value': avg_order_value,
+        'total_value': orders * avg_order_value
+    })
+    
+    # Save raw data (Parquet, or CSV without pyarrow), skipping tables unchanged since the last run
+    hash_cache = read_hash_cache()
+    write_table(daily_sales_data, "daily_sales_raw", hash_cache)
+    write_table(product_sales_data, "product_sales_raw", hash_cache)
+    write_table(customer_segment_data, "customer_segment_raw", hash_cache)
+    write_hash_cache(hash_cache)
     
     # Return all DataFrames in a dictionary
     return {
@@ -147,18 +389,27 @@ def transform_with_pandas(data_frames):
     customer_segments = data_frames['customer_segments']
     
     # 1. Daily sales analysis
-    # Add derived metrics
-    daily_sales['avg_transaction_value'] = daily_sales['revenue'] / daily_sales['transactions']
-    daily_sales['roi'] = (daily_sales['revenue'] - daily_sales['advertising_spend']) / daily_sales['advertising_spend']
-    daily_sales['day_of_week'] = daily_sales['date'].dt.day_name()
+    # Add derived metrics in one assign, on the raw NumPy arrays
+    revenue = daily_sales['revenue'].to_numpy()
+    transactions = daily_sales['transactions'].to_numpy()
+    advertising_spend = daily_sales['advertising_spend'].to_numpy()
+    daily_sales = daily_sales.assign(
+        avg_transaction_value=revenue / transactions,
+        roi=(revenue - advertising_spend) / advertising_spend,
+        # dayofweek is 0=Monday, which is exactly the code of DAY_ORDER; no day_name() strings
+        day_of_week=pd.Categorical.from_codes(daily_sales['date'].dt.dayofweek.to_numpy(dtype=np.int8), categories=DAY_ORDER, ordered=True)
+    )
     
     # Create aggregated views
-    daily_summary = daily_sales.describe()
-    weekly_sales = daily_sales.resample('W', on='date').sum()
+    # Single-pass stats only; describe() would also sort each column for quartiles
+    daily_summary = daily_sales.select_dtypes('number').agg(['count', 'mean', 'std', 'min', 'max'])
+    # Only the additive columns are summed; the ratios are rebuilt from the weekly totals
+    weekly_sales = daily_sales[['date', 'revenue', 'transactions', 'advertising_spend']].resample('W', on='date').sum()
     weekly_sales['avg_transaction_value'] = weekly_sales['revenue'] / weekly_sales['transactions']
     weekly_sales['roi'] = (weekly_sales['revenue'] - weekly_sales['advertising_spend']) / weekly_sales['advertising_spend']
     
-    day_of_week_analysis = daily_sales.groupby('day_of_week').agg({
+    # Ordered categorical: groups come out Monday..Sunday, unobserved days dropped
+    day_of_week_analysis = daily_sales.groupby('day_of_week', observed=True).agg({
         'revenue': 'mean',
         'transactions': 'mean',
         'advertising_spend': 'mean',
@@ -167,63 +418,77 @@ def transform_with_pandas(data_frames):
     }).reset_index()
     
     # 2. Product sales analysis
+    # One scan over product_sales; every product belongs to a single category,
+    # so the category totals roll up from the per-product partial sums
+    per_product = product_sales.groupby(['category', 'product'], sort=False, observed=True).agg(
+        units_sold=('units_sold', 'sum'),
+        total_sales=('total_sales', 'sum'),
+        price_sum=('unit_price', 'sum'),
+        price_count=('unit_price', 'count')
+    )
+    
     # Product performance metrics
-    product_summary = product_sales.groupby('product').agg({
-        'units_sold': 'sum',
-        'total_sales': 'sum',
-        'unit_price': 'mean'
-    }).reset_index()
+    product_summary = per_product.reset_index(level='category', drop=True).reset_index()
+    product_summary['unit_price'] = product_summary.pop('price_sum') / product_summary.pop('price_count')
     
     product_summary['avg_daily_sales'] = product_summary['total_sales'] / 31
     product_summary['market_share'] = product_summary['total_sales'] / product_summary['total_sales'].sum() * 100
     product_summary = product_summary.sort_values('total_sales', ascending=False)
     
     # Category analysis
-    category_summary = product_sales.groupby('category').agg({
-        'units_sold': 'sum',
-        'total_sales': 'sum'
-    }).reset_index()
+    category_summary = per_product.groupby(level='category', sort=False, observed=True).sum().reset_index()
+    category_summary['avg_price'] = category_summary.pop('price_sum') / category_summary.pop('price_count')
     
-    category_summary['avg_price'] = product_sales.groupby('category')['unit_price'].mean().values
     category_summary['market_share'] = category_summary['total_sales'] / category_summary['total_sales'].sum() * 100
     
-    # Daily trend by product
-    product_daily = product_sales.groupby(['date', 'product']).agg({
-        'units_sold': 'sum',
-        'total_sales': 'sum'
-    }).reset_index()
+    # Daily trend by product; extract emits exactly one row per (date, product),
+    # so the per-pair sums are the rows themselves
+    product_daily = product_sales[['date', 'product', 'units_sold', 'total_sales']].copy()
     
     # 3. Customer segment analysis
-    segment_summary = customer_segments.groupby('segment').agg({
-        'orders': 'sum',
-        'avg_order_value': 'mean',
-        'total_value': 'sum'
-    }).reset_index()
+    segment_summary = customer_segments.groupby('segment', sort=False, observed=True).agg(
+        orders=('orders', 'sum'),
+        avg_order_value=('avg_order_value', 'mean'),
+        total_value=('total_value', 'sum')
+    ).reset_index()
     
     segment_summary['customer_share'] = segment_summary['total_value'] / segment_summary['total_value'].sum() * 100
     
-    region_summary = customer_segments.groupby('region').agg({
-        'orders': 'sum',
-        'avg_order_value': 'mean',
-        'total_value': 'sum'
-    }).reset_index()
+    region_summary = customer_segments.groupby('region', sort=False, observed=True).agg(
+        orders=('orders', 'sum'),
+        avg_order_value=('avg_order_value', 'mean'),
+        total_value=('total_value', 'sum')
+    ).reset_index()
     
     # Cross-tabulation of segment and region
-    segment_region_matrix = pd.pivot_table(
-        customer_segments, 
-        values='total_value', 
-        index='segment', 
-        columns='region', 
-        aggfunc='sum'
+    # Both keys are categorical, so their codes index a segment x region grid directly;
+    # the labels stay plain strings, as Parquet cannot restore a categorical column index
+    segments = customer_segments['segment'].cat
+    regions = customer_segments['region'].cat
+    n_regions = len(regions.categories)
+    grid = np.bincount(
+        segments.codes.to_numpy() * n_regions + regions.codes.to_numpy(),
+        weights=customer_segments['total_value'].to_numpy(),
+        minlength=len(segments.categories) * n_regions
+    ).reshape(len(segments.categories), n_regions)
+    segment_region_matrix = pd.DataFrame(
+        grid,
+        index=pd.Index(segments.categories, name='segment'),
+        columns=pd.Index(regions.categories, name='region')
     )
     
     # 4. Time series analysis
     # Add moving averages to daily sales
-    daily_sales['revenue_7d_ma'] = daily_sales['revenue'].rolling(window=7).mean()
-    daily_sales['transactions_7d_ma'] = daily_sales['transactions'].rolling(window=7).mean()
-    
-    # Create correlation matrix
-    correlation_matrix = daily_sales[['revenue', 'transactions', 'advertising_spend', 'avg_transaction_value', 'roi']].corr()
+    daily_sales['revenue_7d_ma'] = moving_average(daily_sales['revenue'], 7)
+    daily_sales['transactions_7d_ma'] = moving_average(daily_sales['transactions'], 7)
+    
+    # Create correlation matrix (these columns never contain NaN, so plain corrcoef is exact)
+    correlation_columns = ['revenue', 'transactions', 'advertising_spend', 'avg_transaction_value', 'roi']
+    correlation_matrix = pd.DataFrame(
+        np.corrcoef(daily_sales[correlation_columns].to_numpy(dtype=np.float64).T),
+        index=correlation_columns,
+        columns=correlation_columns
+    )
     
     # Return all transformed data
     transformed_data = {
@@ -256,10 +521,14 @@ def load_results_and_visualize(transformed_data):
     """
     print("Loading results and creating visualizations with seaborn...")
     
-    # Save all transformed DataFrames to CSV
-    for name, df in transformed_data.items():
-        if isinstance(df, pd.DataFrame):
-            df.to_csv(f"output/data/{name}.csv")
+    # Save all transformed DataFrames as typed Parquet files, skipping unchanged ones
+    hash_cache = read_hash_cache()
+    data_files = [
+        write_table(df, name, hash_cache)
+        for name, df in transformed_data.items()
+        if isinstance(df, pd.DataFrame)
+    ]
+    write_hash_cache(hash_cache)
     
     # Create a summary report
     total_revenue = transformed_data['daily_sales']['revenue'].sum()
@@ -293,104 +562,84 @@ def load_results_and_visualize(transformed_data):
     }
     
     summary_df = pd.DataFrame(summary_data)
-    summary_df.to_csv("output/data/summary_report.csv", index=False)
-    
-    # Create visualizations with seaborn
-    visualizations = []
-    
-    # 1. Daily Revenue Trend
-    plt.figure(figsize=(12, 6))
-    sns.lineplot(x='date', y='revenue', data=transformed_data['daily_sales'], label='Daily Revenue')
-    sns.lineplot(x='date', y='revenue_7d_ma', data=transformed_data['daily_sales'], label='7-Day Moving Average')
-    plt.title('Daily Revenue Trend', fontsize=16)
-    plt.xlabel('Date', fontsize=14)
-    plt.ylabel('Revenue ($)', fontsize=14)
-    plt.legend(fontsize=12)
-    plt.tight_layout()
-    plt.savefig('output/visualizations/daily_revenue_trend.png', dpi=300)
-    visualizations.append('daily_revenue_trend.png')
-    plt.close()
-    
-    # 2. Day of Week Analysis
-    plt.figure(figsize=(10, 6))
-    day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    day_data = transformed_data['day_of_week_analysis'].set_index('day_of_week').reindex(day_order)
-    sns.barplot(x=day_data.index, y='revenue', data=day_data, palette='viridis')
-    plt.title('Average Revenue by Day of Week', fontsize=16)
-    plt.xlabel('Day of Week', fontsize=14)
-    plt.ylabel('Average Revenue ($)', fontsize=14)
-    plt.tight_layout()
-    plt.savefig('output/visualizations/revenue_by_day.png', dpi=300)
-    visualizations.append('revenue_by_day.png')
-    plt.close()
-    
-    # 3. Product Sales Distribution
-    plt.figure(figsize=(10, 6))
-    sns.barplot(x='product', y='total_sales', data=transformed_data['product_summary'], palette='viridis')
-    plt.title('Total Sales by Product', fontsize=16)
-    plt.xlabel('Product', fontsize=14)
-    plt.ylabel('Total Sales ($)', fontsize=14)
-    plt.xticks(rotation=45)
-    plt.tight_layout()
-    plt.savefig('output/visualizations/product_sales.png', dpi=300)
-    visualizations.append('product_sales.png')
-    plt.close()
-    
-    # 4. Category Comparison
-    plt.figure(figsize=(8, 5))
-    sns.barplot(x='category', y='total_sales', data=transformed_data['category_summary'], palette='viridis')
-    plt.title('Sales by Product Category', fontsize=16)
-    plt.xlabel('Category', fontsize=14)
-    plt.ylabel('Total Sales ($)', fontsize=14)
-    plt.tight_layout()
-    plt.savefig('output/visualizations/category_sales.png', dpi=300)
-    visualizations.append('category_sales.png')
-    plt.close()
-    
-    # 5. Customer Segment Value
-    plt.figure(figsize=(8, 5))
-    sns.barplot(x='segment', y='total_value', data=transformed_data['segment_summary'], palette='viridis')
-    plt.title('Total Value by Customer Segment', fontsize=16)
-    plt.xlabel('Customer Segment', fontsize=14)
-    plt.ylabel('Total Value ($)', fontsize=14)
-    plt.tight_layout()
-    plt.savefig('output/visualizations/segment_value.png', dpi=300)
-    visualizations.append('segment_value.png')
-    plt.close()
-    
-    # 6. Correlation Heatmap
-    plt.figure(figsize=(10, 8))
-    sns.heatmap(transformed_data['correlation_matrix'], annot=True, cmap='coolwarm', fmt='.2f', linewidths=0.5)
-    plt.title('Correlation Matrix', fontsize=16)
-    plt.tight_layout()
-    plt.savefig('output/visualizations/correlation_matrix.png', dpi=300)
-    visualizations.append('correlation_matrix.png')
-    plt.close()
-    
-    # 7. Region Comparison
-    plt.figure(figsize=(8, 5))
-    sns.barplot(x='region', y='total_value', data=transformed_data['region_summary'], palette='viridis')
-    plt.title('Total Value by Region', fontsize=16)
-    plt.xlabel('Region', fontsize=14)
-    plt.ylabel('Total Value ($)', fontsize=14)
-    plt.tight_layout()
-    plt.savefig('output/visualizations/region_value.png', dpi=300)
-    visualizations.append('region_value.png')
-    plt.close()
-    
-    # 8. Segment-Region Heatmap
-    plt.figure(figsize=(10, 8))
-    sns.heatmap(transformed_data['segment_region_matrix'], annot=True, cmap='YlGnBu', fmt='.0f', linewidths=0.5)
-    plt.title('Customer Value by Segment and Region', fontsize=16)
-    plt.tight_layout()
-    plt.savefig('output/visualizations/segment_region_heatmap.png', dpi=300)
-    visualizations.append('segment_region_heatmap.png')
-    plt.close()
+    write_csv(summary_df, "output/data/summary_report.csv", index=False)
+    
+    # Create visualizations with seaborn. Each chart only gets plain arrays and
+    # labels, so the tasks pickle cheaply and render in parallel processes.
+    daily_sales = transformed_data['daily_sales']
+    day_data = transformed_data['day_of_week_analysis']
+    product_summary = transformed_data['product_summary']
+    category_summary = transformed_data['category_summary']
+    segment_summary = transformed_data['segment_summary']
+    region_summary = transformed_data['region_summary']
+    correlation_matrix = transformed_data['correlation_matrix']
+    segment_region_matrix = transformed_data['segment_region_matrix']
+    
+    chart_tasks = [
+        # 1. Daily Revenue Trend
+        ('line', 'daily_revenue_trend.png', {
+            'x': daily_sales['date'].to_numpy(),
+            'series': [
+                (daily_sales['revenue'].to_numpy(), 'Daily Revenue'),
+                (daily_sales['revenue_7d_ma'].to_numpy(), '7-Day Moving Average')
+            ],
+            'title': 'Daily Revenue Trend', 'xlabel': 'Date', 'ylabel': 'Revenue ($)'
+        }),
+        # 2. Day of Week Analysis
+        ('bar', 'revenue_by_day.png', {
+            'labels': day_data['day_of_week'].astype(str).tolist(),
+            'values': day_data['revenue'].to_numpy(),
+            'title': 'Average Revenue by Day of Week', 'xlabel': 'Day of Week',
+            'ylabel': 'Average Revenue ($)', 'figsize': (10, 6)
+        }),
+        # 3. Product Sales Distribution
+        ('bar', 'product_sales.png', {
+            'labels': product_summary['product'].astype(str).tolist(),
+            'values': product_summary['total_sales'].to_numpy(),
+            'title': 'Total Sales by Product', 'xlabel': 'Product',
+            'ylabel': 'Total Sales ($)', 'figsize': (10, 6), 'rotation': 45
+        }),
+        # 4. Category Comparison
+        ('bar', 'category_sales.png', {
+            'labels': category_summary['category'].astype(str).tolist(),
+            'values': category_summary['total_sales'].to_numpy(),
+            'title': 'Sales by Product Category', 'xlabel': 'Category', 'ylabel': 'Total Sales ($)'
+        }),
+        # 5. Customer Segment Value
+        ('bar', 'segment_value.png', {
+            'labels': segment_summary['segment'].astype(str).tolist(),
+            'values': segment_summary['total_value'].to_numpy(),
+            'title': 'Total Value by Customer Segment', 'xlabel': 'Customer Segment', 'ylabel': 'Total Value ($)'
+        }),
+        # 6. Correlation Heatmap
+        ('heatmap', 'correlation_matrix.png', {
+            'values': correlation_matrix.to_numpy(),
+            'index': correlation_matrix.index.tolist(),
+            'columns': correlation_matrix.columns.tolist(),
+            'cmap': 'coolwarm', 'fmt': '.2f', 'title': 'Correlation Matrix'
+        }),
+        # 7. Region Comparison
+        ('bar', 'region_value.png', {
+            'labels': region_summary['region'].astype(str).tolist(),
+            'values': region_summary['total_value'].to_numpy(),
+            'title': 'Total Value by Region', 'xlabel': 'Region', 'ylabel': 'Total Value ($)'
+        }),
+        # 8. Segment-Region Heatmap
+        ('heatmap', 'segment_region_heatmap.png', {
+            'values': segment_region_matrix.to_numpy(),
+            'index': segment_region_matrix.index.astype(str).tolist(),
+            'columns': segment_region_matrix.columns.tolist(),
+            'cmap': 'YlGnBu', 'fmt': '.0f', 'title': 'Customer Value by Segment and Region'
+        })
+    ]
+    
+    with ProcessPoolExecutor(max_workers=min(len(chart_tasks), os.cpu_count() or 1)) as executor:
+        visualizations = list(executor.map(render_chart, chart_tasks))
     
     # Create a summary of the operation
     summary = {
         "timestamp": datetime.now().isoformat(),
-        "data_files_created": [f"data/{name}.csv" for name in transformed_data.keys() if isinstance(transformed_data[name], pd.DataFrame)],
+        "data_files_created": data_files,
         "visualizations_created": visualizations,
         "summary_metrics": {
             "total_revenue": total_revenue,
@@ -408,18 +657,16 @@ def load_results_and_visualize(transformed_data):
     return summary
 
 
+# Create the framework and register this module's phases once, at import,
+# instead of on every run
+framework = DataMigrationFramework()
+framework.register_phases_from_annotations(sys.modules[__name__])
+
+
 def run_pandas_migration():
     """
     Run the pandas-based data migration process.
     """
-    # Create an instance of the framework
-    framework = DataMigrationFramework()
-    
-    # Register the current module
-    import sys
-    current_module = sys.modules[__name__]
-    framework.register_phases_from_annotations(current_module)
-    
     # Execute the migration process
     print("\n===== STARTING PANDAS-BASED DATA MIGRATION =====\n")
     result = framework.run()
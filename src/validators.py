@@ -1,10 +1,13 @@
 import re
-from pydantic import BaseModel, Field, validator, root_validator, field_validator, model_validator
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, field_validator, model_validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 import pandas as pd
 import numpy as np
 
+# Characters rejected in column1, compiled once for the model validator and the vectorized checks
+SPECIAL_CHARS = re.compile(r'[!@#$%^&*()_+=\[\]{}|\\:;"\'<>,.?/~`]')
+
 # Basic source data models for validation
 class SourceRecord(BaseModel):
     """Pydantic model for validating individual source records"""
@@ -15,26 +18,27 @@ class SourceRecord(BaseModel):
     created_at: Optional[datetime] = None
     
     @field_validator('column1')
-    def column1_must_not_contain_special_chars(self, v):
+    @classmethod
+    def column1_must_not_contain_special_chars(cls, v):
         """Validate that column1 doesn't contain special characters"""
-        if re.search(r'[!@#$%^&*()_+=\[\]{}|\\:;"\'<>,.?/~`]', v):
+        if SPECIAL_CHARS.search(v):
             raise ValueError("column1 should not contain special characters")
         return v
     
     @field_validator('column3')
-    def column3_must_be_in_range(self, v):
+    @classmethod
+    def column3_must_be_in_range(cls, v):
         """Validate that column3 is within acceptable range"""
         if v is not None and (v < 0 or v > 1000):
             raise ValueError("column3 must be between 0 and 1000")
         return v
     
     @model_validator(mode='after')
-    def check_created_at_not_future(cls, values):
+    def check_created_at_not_future(self):
         """Validate that created_at is not in the future"""
-        created_at = values.get('created_at')
-        if created_at and created_at > datetime.now():
+        if self.created_at and self.created_at > datetime.now():
             raise ValueError("created_at cannot be in the future")
-        return values
+        return self
 
 class SourceDetailRecord(BaseModel):
     """Pydantic model for validating source detail records"""
@@ -43,6 +47,7 @@ class SourceDetailRecord(BaseModel):
     detail_data: Optional[str] = Field(None, max_length=500, description="Detail data")
     
     @field_validator('detail_data')
+    @classmethod
     def detail_data_must_be_valid_format(cls, v):
         """Validate that detail_data has a valid format if present"""
         if v and not v.strip():
@@ -54,7 +59,8 @@ class SourceDataset(BaseModel):
     records: List[SourceRecord]
     detail_records: Optional[List[SourceDetailRecord]] = None
     
-    @validator('records')
+    @field_validator('records')
+    @classmethod
     def records_must_not_be_empty(cls, v):
         """Validate that dataset contains at least one record"""
         if not v:
@@ -62,19 +68,135 @@ class SourceDataset(BaseModel):
         return v
     
     @model_validator(mode='after')
-    def check_detail_references(cls, values):
+    def check_detail_references(self):
         """Validate that all detail records reference existing source records"""
-        records = values.get('records', [])
-        detail_records = values.get('detail_records', [])
+        records = self.records
+        detail_records = self.detail_records
         
         if records and detail_records:
-            source_ids = {record.id for record in records}
-            invalid_details = [d for d in detail_records if d.source_id not in source_ids]
+            ids = np.fromiter((record.id for record in records), dtype=np.int64, count=len(records))
+            source_ids = np.fromiter((d.source_id for d in detail_records), dtype=np.int64, count=len(detail_records))
+            # source_id repeats across details, so assume_unique does not apply
+            unknown = source_ids[~np.isin(source_ids, ids)]
             
-            if invalid_details:
-                raise ValueError(f"Detail records reference non-existent source IDs: {[d.source_id for d in invalid_details]}")
+            if unknown.size:
+                raise ValueError(f"Detail records reference non-existent source IDs: {unknown.tolist()}")
+        
+        return self
+
+# Adapters validate a whole list of records in a single pydantic-core call
+# instead of constructing the models one by one from Python
+SOURCE_RECORDS_ADAPTER = TypeAdapter(List[SourceRecord])
+SOURCE_DETAILS_ADAPTER = TypeAdapter(List[SourceDetailRecord])
+
+def failed_record_indices(error: ValidationError) -> List[int]:
+    """
+    Collect the positions of the list items a batch validation rejected
+    
+    Args:
+        error: ValidationError raised by one of the list adapters
+        
+    Returns:
+        Sorted list of item positions with at least one error
+    """
+    return sorted({
+        detail['loc'][0] for detail in error.errors()
+        if detail['loc'] and isinstance(detail['loc'][0], int)
+    })
+
+def validation_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Convert a DataFrame to records for the Pydantic adapters
+    
+    Args:
+        df: DataFrame to convert
+        
+    Returns:
+        One dictionary per row, with missing values (NaN/NaT/NA) as None so
+        they validate as unset Optional fields
+    """
+    return df.astype(object).where(df.notna(), None).to_dict(orient='records')
+
+def invalid_record_mask(df: pd.DataFrame) -> Optional[np.ndarray]:
+    """
+    Check the SourceRecord constraints column-wise
+    
+    Args:
+        df: Source DataFrame
+        
+    Returns:
+        Boolean array marking rows that break a constraint, or None when the
+        column dtypes don't allow a vectorized check (use Pydantic instead)
+    """
+    if 'id' not in df or 'column1' not in df:
+        return None
+    if not pd.api.types.is_integer_dtype(df['id']) or not pd.api.types.is_string_dtype(df['column1']):
+        return None
+    
+    # Optional columns holding no values at all (e.g. an all-NULL column read
+    # back as object dtype) have nothing to check, whatever their dtype
+    present = {column for column in ('column2', 'column3', 'created_at')
+               if column in df and not df[column].isna().all()}
+    if 'column2' in present and not pd.api.types.is_string_dtype(df['column2']):
+        return None
+    if 'column3' in present and not (pd.api.types.is_float_dtype(df['column3']) or pd.api.types.is_integer_dtype(df['column3'])):
+        return None
+    if 'created_at' in present and not pd.api.types.is_datetime64_dtype(df['created_at']):
+        return None
+    
+    invalid = (df['id'] <= 0).to_numpy(dtype=bool, copy=True)
+    
+    column1 = df['column1']
+    lengths = column1.str.len()
+    invalid |= column1.isna().to_numpy()
+    invalid |= ((lengths < 1) | (lengths > 100)).to_numpy(dtype=bool, na_value=False)
+    invalid |= column1.str.contains(SPECIAL_CHARS.pattern, regex=True, na=False).to_numpy(dtype=bool)
+    
+    if 'column2' in present:
+        invalid |= (df['column2'].str.len() > 200).to_numpy(dtype=bool, na_value=False)
+    if 'column3' in present:
+        column3 = df['column3']
+        invalid |= ((column3 < 0) | (column3 > 1000)).to_numpy(dtype=bool, na_value=False)
+    if 'created_at' in present:
+        invalid |= (df['created_at'] > pd.Timestamp.now()).to_numpy(dtype=bool)
+    
+    return invalid
+
+def mask_validation_result(df: pd.DataFrame, invalid: np.ndarray) -> Dict[str, Any]:
+    """
+    Build the validate_dataframe result from a vectorized error mask
+    
+    Args:
+        df: Source DataFrame the mask was computed on
+        invalid: Boolean array marking the rows that failed
         
-        return values
+    Returns:
+        Dictionary containing validation results
+    """
+    positions = np.flatnonzero(invalid)
+    if positions.size == 0:
+        return {
+            "valid": True,
+            "validated_count": len(df),
+            "detail_count": 0,
+            "errors": []
+        }
+    
+    # Only the failing rows go through Pydantic, to get readable error messages
+    try:
+        SOURCE_RECORDS_ADAPTER.validate_python(validation_records(df.iloc[positions]))
+        errors = [f"{positions.size} records failed validation"]
+    except Exception as e:
+        errors = [str(e)]
+    
+    error_indices = df.index[positions].tolist()
+    return {
+        "valid": False,
+        "errors": errors,
+        "validated_count": len(df) - len(error_indices),
+        "error_count": len(error_indices),
+        "error_indices": error_indices
+    }
 
 # Validation functions for pandas DataFrames
 def validate_dataframe(df: pd.DataFrame, detail_df: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
@@ -97,18 +219,46 @@ def validate_dataframe(df: pd.DataFrame, detail_df: Optional[pd.DataFrame] = Non
             "error_count": 0
         }
     
+    # Fast path: the main-record constraints checked column-wise, no per-row models
+    if detail_df is None:
+        invalid = invalid_record_mask(df)
+        if invalid is not None:
+            return mask_validation_result(df, invalid)
+    
     # Convert DataFrames to dictionaries for Pydantic validation
+    records = validation_records(df)
+    try:
+        source_records = SOURCE_RECORDS_ADAPTER.validate_python(records)
+    except ValidationError as e:
+        # Report every failing row, not just the first error
+        error_indices = df.index[failed_record_indices(e)].tolist()
+        return {
+            "valid": False,
+            "errors": [str(e)],
+            "validated_count": len(records) - len(error_indices),
+            "error_count": len(error_indices),
+            "error_indices": error_indices
+        }
+    except Exception as e:
+        return {
+            "valid": False,
+            "errors": [str(e)],
+            "validated_count": 0,
+            "error_count": 1
+        }
+    
     try:
-        records = df.to_dict(orient='records')
-        source_records = [SourceRecord(**record) for record in records]
-        
         detail_records = None
         if detail_df is not None and not detail_df.empty:
-            detail_dicts = detail_df.to_dict(orient='records')
-            detail_records = [SourceDetailRecord(**record) for record in detail_dicts]
-        
-        # Validate entire dataset
-        dataset = SourceDataset(records=source_records, detail_records=detail_records)
+            detail_dicts = validation_records(detail_df)
+            detail_records = SOURCE_DETAILS_ADAPTER.validate_python(detail_dicts)
+            
+            # Same check as SourceDataset.check_detail_references, done on the
+            # id columns instead of the validated model objects
+            source_ids = detail_df['source_id'].to_numpy()
+            unknown = source_ids[~np.isin(source_ids, df['id'].to_numpy())]
+            if unknown.size:
+                raise ValueError(f"Detail records reference non-existent source IDs: {unknown.tolist()}")
         
         return {
             "valid": True,
@@ -131,25 +281,15 @@ def validate_source_data(data_dict: Dict[str, pd.DataFrame]) -> Dict[str, Any]:
     Validate source data dictionary containing DataFrames
     
     Args:
-        data_dict: Dictionary containing DataFrames
+        data_dict: Dictionary containing the merged DataFrame under 'df_merged'
         
     Returns:
         Dictionary containing validation results
     """
     validation_results = {}
     
-    # Validate raw data
-    if 'df_raw' in data_dict and not data_dict['df_raw'].empty:
-        validation_results['raw_data'] = validate_dataframe(data_dict['df_raw'])
-    
-    # Validate ORM data
-    if 'df_orm' in data_dict and not data_dict['df_orm'].empty:
-        validation_results['orm_data'] = validate_dataframe(
-            data_dict['df_orm'], 
-            data_dict.get('df_details')
-        )
-    
-    # Validate merged data
+    # Validate merged data - the extract produces only the source table
+    # joined with its details, so there are no separate raw/ORM frames
     if 'df_merged' in data_dict and not data_dict['df_merged'].empty:
         validation_results['merged_data'] = validate_dataframe(data_dict['df_merged'])
     
@@ -215,6 +355,10 @@ def validate_transformed_data(df: pd.DataFrame) -> Dict[str, Any]:
             "records_with_errors": 0
         }
     
+    # Column-wise checks when column3_transformed is numeric (what the transform produces)
+    if 'column3_transformed' not in df or pd.api.types.is_numeric_dtype(df['column3_transformed']):
+        return transformed_mask_validation(df)
+    
     # Convert DataFrame to records for row-by-row validation
     records = df.to_dict(orient='records')
     validation_results = [validate_transformed_row(record) for record in records]
@@ -228,4 +372,69 @@ def validate_transformed_data(df: pd.DataFrame) -> Dict[str, Any]:
         "records_with_errors": len(invalid_records),
         "error_indices": invalid_records,
         "error_details": [validation_results[i] for i in invalid_records] if invalid_records else []
+    }
+
+def column_type_mask(df: pd.DataFrame, column: str, is_valid_type, types) -> np.ndarray:
+    """
+    Flag the rows whose value in a column is missing or not of the expected type
+    
+    Args:
+        df: DataFrame to check
+        column: Column name
+        is_valid_type: dtype predicate under which every non-null value has the type
+        types: Python types accepted in an object column
+        
+    Returns:
+        Boolean array, True where the value is missing or of the wrong type
+    """
+    if column not in df:
+        return np.ones(len(df), dtype=bool)
+    values = df[column]
+    if values.dtype == object:
+        return ~values.map(lambda v: isinstance(v, types)).to_numpy(dtype=bool)
+    if is_valid_type(values.dtype):
+        return values.isna().to_numpy(dtype=bool)
+    return np.ones(len(df), dtype=bool)
+
+def transformed_mask_validation(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Vectorized equivalent of applying validate_transformed_row to every row
+    
+    Args:
+        df: Transformed DataFrame, column3_transformed numeric if present
+        
+    Returns:
+        Dictionary with validation results, same shape as validate_transformed_data
+    """
+    from kernels import column3_transformed_out_of_range
+    
+    bad_id = column_type_mask(df, 'id', pd.api.types.is_integer_dtype, (int, np.integer))
+    bad_column1 = column_type_mask(df, 'column1', pd.api.types.is_string_dtype, str)
+    if 'column3_transformed' in df:
+        bad_column3 = column3_transformed_out_of_range(
+            df['column3_transformed'].to_numpy(dtype=np.float64, na_value=np.nan)
+        )
+    else:
+        bad_column3 = np.zeros(len(df), dtype=bool)
+    
+    invalid_records = np.flatnonzero(bad_id | bad_column1 | bad_column3).tolist()
+    
+    # Messages only for the failing rows, matching validate_transformed_row
+    error_details = []
+    for i in invalid_records:
+        errors = []
+        if bad_id[i]:
+            errors.append("Missing or invalid 'id' field")
+        if bad_column1[i]:
+            errors.append("Missing or invalid 'column1' field")
+        if bad_column3[i]:
+            errors.append("column3_transformed is out of valid range (0-2000)")
+        error_details.append({"valid": False, "errors": errors})
+    
+    return {
+        "valid": len(invalid_records) == 0,
+        "records_validated": len(df),
+        "records_with_errors": len(invalid_records),
+        "error_indices": invalid_records,
+        "error_details": error_details
     } 
\ No newline at end of file
@@ -4,6 +4,8 @@ import os
 
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# The example modules import their siblings (framework, kernels) by plain name
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
 
 # Shared fixtures can be added here
 @pytest.fixture(scope="session")
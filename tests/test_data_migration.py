@@ -0,0 +1,52 @@
+import pytest
+sqlalchemy = pytest.importorskip("sqlalchemy")
+from sqlalchemy.pool import StaticPool
+from src import data_migration
+from models import init_db
+
+
+def make_engine():
+    engine = sqlalchemy.create_engine("sqlite://", poolclass=StaticPool,
+                                      connect_args={"check_same_thread": False})
+    init_db(engine)
+    return engine
+
+
+def run_pipeline(monkeypatch, values):
+    source, target = make_engine(), make_engine()
+    with source.begin() as connection:
+        connection.execute(sqlalchemy.text(
+            "INSERT INTO source_table (id, column1, column2, column3, created_at) VALUES " + values
+        ))
+    monkeypatch.setattr(data_migration, "get_source_engine", lambda: source)
+    monkeypatch.setattr(data_migration, "get_target_engine", lambda: target)
+
+    result = data_migration.save_data_to_target(
+        data_migration.transform_data_with_pandas(data_migration.fetch_data_from_source())
+    )
+
+    assert result["success"]
+    with target.connect() as connection:
+        return connection.execute(sqlalchemy.text(
+            "SELECT id, column3_transformed FROM target_table ORDER BY id"
+        )).fetchall()
+
+
+def test_invalid_source_rows_are_not_loaded(monkeypatch):
+    rows = run_pipeline(monkeypatch,
+        "(1, 'good', 'x', 5, '2024-01-01 00:00:00'), "
+        "(2, 'bad!chars', 'y', -1500, '2024-01-01 00:00:00'), "
+        "(3, 'future', 'z', 7, '2999-01-01 00:00:00')"
+    )
+    assert rows == [(1, 10.0)]
+
+
+def test_repairable_source_rows_are_loaded(monkeypatch):
+    # column3 outside [0, 1000] or missing is cleaned by the transform
+    # (capped, absolute value, defaulted), not rejected
+    rows = run_pipeline(monkeypatch,
+        "(1, 'capped', 'x', 1500, '2024-01-01 00:00:00'), "
+        "(2, 'negative', 'y', -5, '2024-01-01 00:00:00'), "
+        "(3, 'nulls', NULL, NULL, NULL)"
+    )
+    assert rows == [(1, 2000.0), (2, 10.0), (3, 0.0)]
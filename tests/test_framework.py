@@ -1,3 +1,5 @@
+import sys
+import types
 import pytest
 from src.framework import Phase, phase, DataMigrationFramework
 
@@ -57,6 +59,29 @@ def test_register_phases_from_annotations(framework):
     assert "Extract" in framework.phases
     assert "Transform" in framework.phases
 
+def test_register_phases_from_module_registry(framework):
+    # Top-level functions of a real module are registered from the @phase registry
+    framework.register_phases_from_annotations(sys.modules[__name__])
+    assert framework.phases == {
+        "Extract": test_extract,
+        "Transform": test_transform,
+        "Load": test_load
+    }
+
+def test_register_phases_from_module_registry_with_imports(framework):
+    # Phase functions imported into a module are registered next to its own
+    module = types.ModuleType("phase_module")
+    exec("from src.framework import Phase, phase\n"
+         "@phase(Phase.EXTRACT)\n"
+         "def extract():\n"
+         "    return 'extracted'\n", vars(module))
+    module.transform = test_transform
+    framework.register_phases_from_annotations(module)
+    assert framework.phases == {
+        "Extract": module.extract,
+        "Transform": test_transform
+    }
+
 # Test phase execution order
 def test_phase_execution_order(framework):
     execution_order = []
@@ -0,0 +1,32 @@
+import importlib.util
+import sys
+import numpy as np
+import pytest
+import src.kernels
+
+
+@pytest.fixture(params=["installed", "numpy"])
+def kernels(request, monkeypatch):
+    if request.param == "installed":
+        return src.kernels
+    # Load a second copy of the module with Numba hidden, to get the NumPy fallbacks
+    monkeypatch.setitem(sys.modules, "numba", None)
+    spec = importlib.util.spec_from_file_location("kernels_without_numba", src.kernels.__file__)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    assert module.njit is None
+    return module
+
+
+def test_clean_and_transform_column3(kernels):
+    column3 = np.array([5.0, -20.0, np.nan, 1500.0, 0.0, 1000.0])
+    result = kernels.clean_and_transform_column3(column3)
+    np.testing.assert_array_equal(result, [10.0, 40.0, 0.0, 2000.0, 0.0, 2000.0])
+    # The input is left untouched
+    assert np.isnan(column3[2])
+
+
+def test_column3_transformed_out_of_range(kernels):
+    values = np.array([0.0, 2000.0, -0.5, 2000.5, np.nan, 150.0])
+    result = kernels.column3_transformed_out_of_range(values)
+    assert result.tolist() == [False, False, True, True, False, False]
@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+from src.simple import round_cents, transform_data
+
+SOURCE_DATA = [
+    {"id": 1, "name": "Product A", "category": "Electronics", "price": 199.99, "in_stock": True},
+    {"id": 2, "name": "Product B", "category": "Books", "price": 29.99, "in_stock": True},
+    {"id": 3, "name": "Product C", "category": "Electronics", "price": 99.50, "in_stock": False},
+    {"id": 4, "name": "Product D", "category": "Clothing", "price": 49.99, "in_stock": True}
+]
+
+
+def test_transform_data_prices():
+    transformed = transform_data(SOURCE_DATA)
+    product_c = transformed[2]
+    assert product_c["price_eur"] == 90.55
+    assert product_c["discounted_price_usd"] == 89.55
+    for item, record in zip(SOURCE_DATA, transformed):
+        assert record["price_eur"] == round(item["price"] * 0.91, 2)
+        assert record["availability"] == ("In Stock" if item["in_stock"] else "Out of Stock")
+
+
+def test_round_cents_matches_round():
+    prices = pd.Series(np.arange(0, 100_000) / 100.0)
+    for amounts in (prices * 0.91, prices * 0.9, prices * 0.95, -prices * 0.91,
+                    pd.Series(np.arange(-2000, 2000) / 200.0)):
+        expected = [round(amount, 2) for amount in amounts.tolist()]
+        assert round_cents(amounts).tolist() == expected
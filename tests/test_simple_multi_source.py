@@ -0,0 +1,133 @@
+import logging
+import numpy as np
+import pandas as pd
+import pytest
+from src.simple_multi_source import (_dense_slots, _inner_join, _iter_products_xml, _join_sources,
+                                     _write_xml_records, atomic_write, transform_and_join_data)
+
+
+def make_sources():
+    return {
+        "customers": [
+            {"id": 1, "name": "John Smith", "email": "john@example.com", "country": "USA"},
+            {"id": 2, "name": "Maria Garcia", "email": "maria@example.com", "country": "Spain"}
+        ],
+        "orders": [
+            {"order_id": 1001, "customer_id": 1, "products": [101, 102], "total": 129.99, "date": "2023-01-15"},
+            {"order_id": 1002, "customer_id": 2, "products": [102], "total": 29.99, "date": "2023-01-16"}
+        ],
+        "products": [
+            {"product_id": 101, "name": "Smartphone", "category": "Electronics", "price": 99.99},
+            {"product_id": 102, "name": "Headphones", "category": "Electronics", "price": 29.99}
+        ]
+    }
+
+
+def test_join_sources():
+    orders_df, items_df = _join_sources(make_sources())
+    assert orders_df["order_id"].tolist() == [1001, 1002]
+    assert orders_df["customer_name"].tolist() == ["John Smith", "Maria Garcia"]
+    assert items_df["order_id"].tolist() == [1001, 1001, 1002]
+    assert items_df["product_name"].tolist() == ["Smartphone", "Headphones", "Headphones"]
+
+
+def test_join_sources_null_customer(caplog):
+    sources = make_sources()
+    sources["orders"][1]["customer_id"] = None
+    with caplog.at_level(logging.WARNING):
+        orders_df, items_df = _join_sources(sources)
+    assert "Customer not found for orders: [1002]" in caplog.text
+    assert orders_df["order_id"].tolist() == [1001]
+    assert items_df["order_id"].tolist() == [1001, 1001]
+
+
+def test_join_sources_null_product(caplog):
+    sources = make_sources()
+    sources["orders"][0]["products"] = [101, None]
+    with caplog.at_level(logging.WARNING):
+        orders_df, items_df = _join_sources(sources)
+    assert "(1001, None)" in caplog.text
+    assert items_df["order_id"].tolist() == [1001, 1002]
+    assert items_df["product_id"].tolist() == [101, 102]
+
+
+@pytest.mark.parametrize("source", ["orders", "customers", "products"])
+def test_join_sources_empty_source(source):
+    sources = make_sources()
+    sources[source] = []
+    orders_df, items_df = _join_sources(sources)
+    assert "customer_name" in orders_df.columns
+    assert "product_name" in items_df.columns
+    assert items_df.empty
+    assert orders_df.empty == (source != "products")
+
+
+def test_sales_by_country_counts_customer_names():
+    sources = make_sources()
+    sources["customers"].append({"id": 3, "name": "John Smith", "email": "js@example.com", "country": "USA"})
+    sources["orders"].append({"order_id": 1003, "customer_id": 3, "products": [101],
+                              "total": 99.99, "date": "2023-01-17"})
+    report = transform_and_join_data(sources)["sales_by_country"]
+    assert report["USA"]["order_count"] == 2
+    assert report["USA"]["customer_count"] == 1
+    assert report["Spain"]["customer_count"] == 1
+
+
+def test_dense_slots():
+    low, slots = _dense_slots(np.array([12, 10, 11]))
+    assert low == 10
+    assert slots.tolist() == [1, 2, 0]
+    # Duplicates, sparse keys and non-integer keys have no direct-address table
+    assert _dense_slots(np.array([1, 1, 2])) is None
+    assert _dense_slots(np.array([1, 1000])) is None
+    assert _dense_slots(np.array([1.0, 2.0])) is None
+
+
+def test_inner_join_matches_merge():
+    left = pd.DataFrame({"key": [3, 1, 7, 2, 1], "value": list("abcde")})
+    right = pd.DataFrame({"key": [1, 2, 3], "name": ["one", "two", "three"]})
+    expected = left.merge(right, on="key", how="inner", sort=False)
+    pd.testing.assert_frame_equal(_inner_join(left, right, "key"), expected)
+
+    # Non-unique right keys take the merge path
+    right = pd.DataFrame({"key": [1, 1, 2], "name": ["one", "uno", "two"]})
+    expected = left.merge(right, on="key", how="inner", sort=False)
+    pd.testing.assert_frame_equal(_inner_join(left, right, "key"), expected)
+
+
+def test_atomic_write_replaces_file(tmp_path):
+    path = tmp_path / "out.txt"
+    path.write_text("old")
+    with atomic_write(str(path)) as file:
+        file.write("new")
+        # Readers still see the previous contents until the write completes
+        assert path.read_text() == "old"
+    assert path.read_text() == "new"
+    assert [entry.name for entry in tmp_path.iterdir()] == ["out.txt"]
+
+
+def test_atomic_write_failure_keeps_old_file(tmp_path):
+    path = tmp_path / "out.txt"
+    path.write_text("old")
+    with pytest.raises(RuntimeError):
+        with atomic_write(str(path)) as file:
+            file.write("partial")
+            raise RuntimeError("write failed")
+    assert path.read_text() == "old"
+    assert [entry.name for entry in tmp_path.iterdir()] == ["out.txt"]
+
+
+def test_products_xml_round_trip(tmp_path):
+    path = str(tmp_path / "products.xml")
+    products = [
+        {"product_id": 101, "name": "Smartphone", "category": "Electronics", "price": 99.99},
+        {"product_id": 102, "name": "Headphones", "category": None, "price": None}
+    ]
+    _write_xml_records(path, "products", "product", products)
+    assert list(_iter_products_xml(path)) == products
+
+
+def test_products_xml_empty_element(tmp_path):
+    path = tmp_path / "products.xml"
+    path.write_text("<products><product><product_id>7</product_id><name></name></product></products>")
+    assert list(_iter_products_xml(str(path))) == [{"product_id": 7, "name": None}]
@@ -0,0 +1,46 @@
+import importlib
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def simple_pandas(tmp_path, monkeypatch):
+    # The module writes under ./output, so run each test in its own directory
+    monkeypatch.chdir(tmp_path)
+    module = importlib.import_module("src.simple_pandas")
+    (tmp_path / "output" / "data").mkdir(parents=True, exist_ok=True)
+    return module
+
+
+@pytest.mark.parametrize("use_bottleneck", [True, False])
+def test_moving_average(simple_pandas, monkeypatch, use_bottleneck):
+    if not use_bottleneck:
+        monkeypatch.setattr(simple_pandas, "bn", None)
+    elif simple_pandas.bn is None:
+        pytest.skip("Bottleneck is not installed")
+    series = pd.Series([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+    expected = series.rolling(3).mean().to_numpy()
+    np.testing.assert_allclose(simple_pandas.moving_average(series, 3), expected)
+
+
+def test_write_table_skips_unchanged_tables(simple_pandas, tmp_path):
+    df = pd.DataFrame({"value": [1.0, 2.0, 3.0]}, index=pd.Index(["a", "b", "c"], name="key"))
+    hash_cache = simple_pandas.read_hash_cache()
+    path = simple_pandas.write_table(df, "table", hash_cache)
+    simple_pandas.write_hash_cache(hash_cache)
+    written = tmp_path / "output" / path
+    written.write_bytes(b"marker")
+
+    # Same contents: the file is left alone
+    hash_cache = simple_pandas.read_hash_cache()
+    assert simple_pandas.write_table(df, "table", hash_cache) == path
+    assert written.read_bytes() == b"marker"
+
+    # Changed contents, or a missing file, are written again
+    changed = df.assign(value=[1.0, 2.0, 4.0])
+    simple_pandas.write_table(changed, "table", hash_cache)
+    assert written.read_bytes() != b"marker"
+    written.unlink()
+    simple_pandas.write_table(changed, "table", hash_cache)
+    assert written.exists()
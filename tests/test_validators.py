@@ -0,0 +1,88 @@
+import pandas as pd
+import pytest
+from pydantic import ValidationError
+from src.validators import SourceRecord, SourceDetailRecord, SourceDataset, validate_dataframe
+
+
+def make_source_frame():
+    return pd.DataFrame({
+        'id': [1, 2, 3],
+        'column1': ['alpha', 'beta', 'gamma'],
+        'column2': ['x', 'y', 'z'],
+        'column3': [10.0, 500.0, 1000.0],
+        'created_at': pd.to_datetime(['2024-01-01', '2024-01-02', '2024-01-03'])
+    })
+
+
+def test_source_record_validators():
+    record = SourceRecord(id=1, column1='alpha', column3=5.0)
+    assert record.column1 == 'alpha'
+    with pytest.raises(ValidationError):
+        SourceRecord(id=1, column1='bad!')
+    with pytest.raises(ValidationError):
+        SourceRecord(id=1, column1='alpha', column3=1500.0)
+    with pytest.raises(ValidationError):
+        SourceRecord(id=1, column1='alpha', created_at='2999-01-01T00:00:00')
+
+
+def test_source_dataset_detail_references():
+    records = [SourceRecord(id=1, column1='alpha')]
+    SourceDataset(records=records, detail_records=[SourceDetailRecord(id=10, source_id=1)])
+    with pytest.raises(ValidationError):
+        SourceDataset(records=records, detail_records=[SourceDetailRecord(id=11, source_id=2)])
+    with pytest.raises(ValidationError):
+        SourceDataset(records=[])
+
+
+def test_validate_dataframe_valid():
+    result = validate_dataframe(make_source_frame())
+    assert result['valid']
+    assert result['validated_count'] == 3
+
+
+def test_validate_dataframe_reports_failing_rows():
+    df = make_source_frame()
+    df.loc[1, 'column1'] = 'bad!'
+    df.loc[2, 'column3'] = -5.0
+    result = validate_dataframe(df)
+    assert not result['valid']
+    assert result['error_indices'] == [1, 2]
+    assert result['validated_count'] == 1
+
+
+def test_validate_dataframe_all_null_optional_columns():
+    df = make_source_frame()
+    df['column2'] = None
+    df['created_at'] = None
+    result = validate_dataframe(df)
+    assert result['valid']
+    assert result['validated_count'] == 3
+
+
+def test_validate_dataframe_detail_references():
+    df = make_source_frame()
+    details = pd.DataFrame({'id': [10, 11], 'source_id': [1, 3], 'detail_data': ['a', 'b']})
+    result = validate_dataframe(df, details)
+    assert result['valid']
+    assert result['detail_count'] == 2
+
+    details.loc[1, 'source_id'] = 7
+    result = validate_dataframe(df, details)
+    assert not result['valid']
+    assert '[7]' in result['errors'][0]
+
+
+def test_validate_dataframe_fallback_with_null_optional_columns():
+    # created_at as text (as SQLite returns it) takes the Pydantic path
+    df = make_source_frame()
+    df['created_at'] = ['2024-01-01 00:00:00', None, '2024-01-03 00:00:00']
+    df.loc[1, 'column2'] = None
+    df.loc[1, 'column3'] = None
+    result = validate_dataframe(df)
+    assert result['valid']
+    assert result['validated_count'] == 3
+
+    details = pd.DataFrame({'id': [10, 11], 'source_id': [1, 2], 'detail_data': ['a', None]})
+    result = validate_dataframe(df, details)
+    assert result['valid']
+    assert result['detail_count'] == 2